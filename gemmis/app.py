@@ -173,9 +173,9 @@ class GemmisApp(App):
         if not self.app_state.messages:
             chat.add_message("assistant", "Greetings. Systems Online. Neural Interface Ready.")
             return
-        for msg in self.app_state.messages:
-            if msg.get("role") != "system":
-                chat.add_message(msg.get("role"), msg.get("content", ""))
+        for role, content, _ in self.app_state.messages:
+            if role != "system":
+                chat.add_message(role, content or "")
 
     async def breathing_pulse(self):
         """Make the UI 'breathe' by pulsing borders.
@@ -432,7 +432,7 @@ class GemmisApp(App):
         if self.app_state.messages:
             # Find last assistant message
             for i in range(len(self.app_state.messages) - 1, -1, -1):
-                if self.app_state.messages[i].get("role") == "assistant":
+                if self.app_state.messages[i][0] == "assistant":
                     self.app_state.messages.pop(i)
                     break
 
@@ -473,10 +473,8 @@ class GemmisApp(App):
 
             content = f"# GEMMIS Chat Export\n\n**Model:** {self.model_name}\n**Date:** {datetime.now().isoformat()}\n\n---\n\n"
 
-            for msg in self.app_state.messages:
-                role = msg.get("role", "unknown").upper()
-                text = msg.get("content", "")
-                content += f"## {role}\n\n{text}\n\n---\n\n"
+            for role, text, _ in self.app_state.messages:
+                content += f"## {role.upper()}\n\n{text or ''}\n\n---\n\n"
 
             with open(filename, "w") as f:
                 f.write(content)
@@ -21,20 +21,23 @@ from .ui.dashboard import Dashboard
 from .audio import get_audio
 
 
-def save_history(messages: list[dict], filename: str | None = None) -> str:
+def save_history(messages: list[tuple], filename: str | None = None) -> str:
     """Save chat history to file"""
     if filename is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"chat_{timestamp}.json"
 
+    # History files keep the dict shape for readability/compatibility
+    serializable = [{"role": role, "content": content} for role, content, _ in messages]
+
     filepath = HISTORY_DIR / filename
     with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(messages, f, ensure_ascii=False, indent=2)
+        json.dump(serializable, f, ensure_ascii=False, indent=2)
 
     return str(filepath)
 
 
-def load_history(filename: str) -> list[dict] | None:
+def load_history(filename: str) -> list[tuple] | None:
     """Load chat history from file"""
     filepath = HISTORY_DIR / filename
     if not filepath.exists():
@@ -42,7 +45,8 @@ def load_history(filename: str) -> list[dict] | None:
 
     try:
         with open(filepath, encoding="utf-8") as f:
-            return json.load(f)
+            loaded = json.load(f)
+        return [(m["role"], m.get("content", ""), m.get("tool_calls")) for m in loaded]
     except Exception:
         return None
 
@@ -283,9 +287,7 @@ async def handle_command(
         if export_format in ("markdown", "md"):
             filename = f"chat_{timestamp}.md"
             content = "# Chat Export\n\n"
-            for msg in state.messages:
-                role = msg.get("role", "unknown")
-                text = msg.get("content", "")
+            for role, text, _ in state.messages:
                 if role == "user":
                     content += f"## User\n\n{text}\n\n"
                 elif role == "assistant":
@@ -293,9 +295,7 @@ async def handle_command(
         else:
             filename = f"chat_{timestamp}.txt"
             content = "Chat Export\n" + "=" * 50 + "\n\n"
-            for msg in state.messages:
-                role = msg.get("role", "unknown")
-                text = msg.get("content", "")
+            for role, text, _ in state.messages:
                 if role == "user":
                     content += f"USER: {text}\n\n"
                 elif role == "assistant":
@@ -477,10 +477,10 @@ async def handle_command(
         if not state.messages:
              console.print(f"[{Colors.WARNING}]No messages to speak[/]")
         else:
-            last_msg = state.messages[-1]
-            if last_msg.get("role") == "assistant" and last_msg.get("content"):
+            role, content, _ = state.messages[-1]
+            if role == "assistant" and content:
                 console.print(f"[{Colors.SECONDARY}]🔊 Speaking...[/]")
-                await get_audio().speak(last_msg["content"][:500]) # Limit to 500 chars
+                await get_audio().speak(content[:500]) # Limit to 500 chars
             else:
                 console.print(f"[{Colors.WARNING}]Last message was not from assistant[/]")
 
@@ -548,7 +548,7 @@ async def handle_command(
                 # Load messages from session
                 context = await state.session_manager.get_context()
                 state.messages = [
-                    {"role": msg.role, "content": msg.content}
+                    (msg.role, msg.content, None)
                     for msg in context
                     if msg.role != "system"
                 ]
@@ -681,8 +681,7 @@ async def handle_command(
             from .ollama_client import count_tokens
 
             total_tokens = 0
-            for msg in state.messages:
-                content = msg.get("content", "")
+            for _, content, _ in state.messages:
                 if content:
                     total_tokens += count_tokens(content)
 
@@ -30,7 +30,22 @@ from .config import (
     TEMPERATURE,
     TOP_P,
 )
-from .tools import TOOLS, execute_tool_call
+from .tools import TOOLS_JSON, execute_tool_call
+
+# The options block never changes at runtime, so serialize it once at
+# import. chat_stream stitches these pre-encoded fragments together with
+# just the messages list, instead of re-encoding the whole payload on
+# every request. The tools schema comes pre-serialized as TOOLS_JSON.
+_JSON_COMPACT = {"separators": (",", ":")}
+_OPTIONS_SERIALIZED = json.dumps(
+    {
+        "temperature": TEMPERATURE,
+        "top_p": TOP_P,
+        "num_predict": MAX_TOKENS,
+        "num_ctx": CONTEXT_LENGTH,
+    },
+    **_JSON_COMPACT,
+)
 
 
 def count_tokens(text: str) -> int:
@@ -94,6 +109,24 @@ class OllamaClient:
     def __init__(self, model: str = MODEL_NAME):
         self.model = model
         self._client: httpx.AsyncClient | None = None
+        # Cached chat payload prefixes, rebuilt only when the model changes
+        self._payload_prefix_key: tuple[str, bool] | None = None
+        self._payload_prefix: bytes = b""
+
+    def _chat_payload_prefix(self, tools_enabled: bool) -> bytes:
+        """Get the pre-serialized payload prefix up to the messages field."""
+        key = (self.model, tools_enabled)
+        if key != self._payload_prefix_key:
+            prefix = (
+                f'{{"model":{json.dumps(self.model)},"stream":true,'
+                f'"options":{_OPTIONS_SERIALIZED}'
+            )
+            if tools_enabled:
+                prefix += f',"tools":{TOOLS_JSON}'
+            prefix += ',"messages":'
+            self._payload_prefix = prefix.encode()
+            self._payload_prefix_key = key
+        return self._payload_prefix
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None or self._client.is_closed:
@@ -182,25 +215,13 @@ class OllamaClient:
         """
         stats = StreamStats(start_time=time.time())
 
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "stream": True,
-            "options": {
-                "temperature": TEMPERATURE,
-                "top_p": TOP_P,
-                "num_predict": MAX_TOKENS,
-                "num_ctx": CONTEXT_LENGTH,
-            },
-        }
-
-        # Add tools if enabled (only if model supports it)
-        if tools_enabled:
-            try:
-                payload["tools"] = TOOLS
-            except Exception:
-                # If tools fail, continue without them
-                pass
+        # Only the messages list varies per call; everything else is stitched
+        # in from the cached pre-serialized prefix.
+        body = (
+            self._chat_payload_prefix(tools_enabled)
+            + json.dumps(messages, **_JSON_COMPACT).encode()
+            + b"}"
+        )
 
         try:
             client = await self._get_client()
@@ -208,7 +229,8 @@ class OllamaClient:
             async with client.stream(
                 "POST",
                 OLLAMA_CHAT_ENDPOINT,
-                json=payload,
+                content=body,
+                headers={"Content-Type": "application/json"},
             ) as response:
                 if response.status_code != 200:
                     error_text = await response.aread()
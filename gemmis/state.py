@@ -2,17 +2,24 @@
 GEMMIS CLI - Application State Management
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional
 
 from .config import SYSTEM_PROMPT
 
+# Messages are stored as (role, content, tool_calls) tuples rather than dicts:
+# tuples are far smaller (~64 vs ~232 bytes) and iterate without hash lookups,
+# which matters over a long session. The dict shape Ollama expects is built
+# once at the API boundary in get_chat_messages().
+MessageTuple = tuple[str, str, Optional[list]]
+
 
 @dataclass
 class AppState:
     """Application state"""
 
-    messages: list[dict] = field(default_factory=list)
+    messages: list[MessageTuple] = field(default_factory=list)
     system_prompt: str = SYSTEM_PROMPT
     connected: bool = False
     status: str = "READY"
@@ -22,9 +29,10 @@ class AppState:
     tokens_per_sec: float = 0.0
     system_stats: dict = field(default_factory=dict)
 
-    # History for sparklines (store last 20 values)
-    cpu_history: list[float] = field(default_factory=list)
-    mem_history: list[float] = field(default_factory=list)
+    # History for sparklines/graphs; bounded ring buffers so appends
+    # evict the oldest sample in O(1) instead of a list pop(0) memmove
+    cpu_history: deque[float] = field(default_factory=lambda: deque(maxlen=50))
+    mem_history: deque[float] = field(default_factory=lambda: deque(maxlen=50))
     tokens_per_sec_history: list[float] = field(default_factory=list)
 
     # Visual Effects State
@@ -35,14 +43,21 @@ class AppState:
     current_session_id: Optional[str] = None
     use_memory: bool = True  # Enable/disable persistent memory
 
-    async def add_message(self, role: str, content: str):
+    async def add_message(
+        self,
+        role: str,
+        content: str,
+        tool_calls: Optional[list] = None,
+        tool_name: Optional[str] = None,
+    ):
         """Add message to both in-memory list and persistent storage"""
-        self.messages.append({"role": role, "content": content})
-        
+        self.messages.append((role, content, tool_calls))
+
         # Save to persistent storage if memory is enabled
         if self.use_memory and self.session_manager and self.current_session_id:
             try:
-                await self.session_manager.add_message(role, content)
+                metadata = {"tool_name": tool_name} if tool_name else None
+                await self.session_manager.add_message(role, content, metadata=metadata)
             except Exception:
                 # Silently fail if memory system has issues
                 pass
@@ -55,7 +70,7 @@ class AppState:
                 context = await self.session_manager.get_context()
                 # Convert Message objects to dict format
                 self.messages = [
-                    {"role": msg.role, "content": msg.content}
+                    (msg.role, msg.content, None)
                     for msg in context
                     if msg.role != "system"  # Exclude system messages from context
                 ]
@@ -82,14 +97,12 @@ class AppState:
 
         msgs = [{"role": "system", "content": system_context}]
 
-        # Convert messages, handling tool calls
-        for m in self.messages:
-            msg = {"role": m["role"]}
-            if "tool_calls" in m:
-                msg["tool_calls"] = m["tool_calls"]
-                msg["content"] = None
-            else:
-                msg["content"] = m.get("content", "")
-            msgs.append(msg)
+        # Build the outgoing dicts in a single generator pass, handling tool calls
+        msgs.extend(
+            {"role": role, "content": content}
+            if tool_calls is None
+            else {"role": role, "tool_calls": tool_calls, "content": None}
+            for role, content, tool_calls in self.messages
+        )
 
         return msgs
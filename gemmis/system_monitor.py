@@ -2,114 +2,355 @@
 System Monitor - Monitor computer health and resources
 """
 import asyncio
-import subprocess
+import functools
+import heapq
+import operator
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-import psutil
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
+# Sentinel for "not probed yet" (None means "probed, nothing found")
+_UNSET = object()
+
+# Update-count patterns, compiled once: one C-level scan over the whole
+# output instead of per-line startswith/in checks in Python. Byte patterns
+# so the (potentially large) package list never goes through a codec.
+_DNF_UPDATE_RE = re.compile(rb"^(?!Last|Upgraded).*\S", re.M)
+_APT_UPDATE_RE = re.compile(rb"^(?!.*Listing\.\.\.).*/.*$", re.M)
+_PACMAN_UPDATE_RE = re.compile(rb"^.*\S", re.M)
+
+# Pseudo/virtual filesystems whose usage numbers are never interesting
+_SKIP_FSTYPES = frozenset(
+    {
+        "autofs",
+        "bpf",
+        "cgroup",
+        "cgroup2",
+        "configfs",
+        "debugfs",
+        "devpts",
+        "devtmpfs",
+        "fusectl",
+        "hugetlbfs",
+        "mqueue",
+        "nsfs",
+        "overlay",
+        "proc",
+        "pstore",
+        "ramfs",
+        "securityfs",
+        "squashfs",
+        "sysfs",
+        "tmpfs",
+        "tracefs",
+    }
+)
+
+# Sort keys for get_top_processes, built once instead of per call
+_CPU_KEY = operator.itemgetter("cpu_percent")
+_MEM_KEY = operator.itemgetter("memory_percent")
+
+# Health thresholds (percent) and their messages, in one tunable place
+# instead of magic numbers and strings rebuilt inside get_system_health
+CPU_WARN = 80
+CPU_CRIT = 90
+MEM_WARN = 80
+MEM_CRIT = 90
+DISK_WARN = 80
+DISK_CRIT = 90
+SWAP_WARN = 50
+RECOMMEND_LOAD = 70
+
+_MSG_CPU_CRIT = f"CPU usage is very high (>{CPU_CRIT}%)"
+_MSG_CPU_WARN = f"CPU usage is high (>{CPU_WARN}%)"
+_MSG_MEM_CRIT = f"Memory usage is critical (>{MEM_CRIT}%)"
+_MSG_MEM_WARN = f"Memory usage is high (>{MEM_WARN}%)"
+_MSG_SWAP_WARN = "Swap usage is high - consider adding more RAM"
+_MSG_FREE_MEMORY = "Consider closing unused applications to free memory"
+_MSG_CHECK_CPU = "Check for CPU-intensive processes"
+_MSG_CLEAN_DISK = "Consider cleaning up disk space"
+
+
+@functools.cache
+def _cpu_count() -> int | None:
+    """Logical core count; never changes for the process lifetime"""
+    return psutil.cpu_count()
+
+
+def _ttl_cache(seconds: float = 1.0):
+    """Cache an async method's result on the instance for a short window.
+
+    Polling consumers (dashboard, sidebar, health checks) often read the
+    same stats within the same second; the cache spares the redundant
+    to_thread dispatch and /proc reads. Pass fresh=True to bypass.
+    """
+
+    def decorator(method):
+        attr = f"_cache_{method.__name__}"
+
+        @functools.wraps(method)
+        async def wrapper(self, *args, fresh: bool = False, **kwargs):
+            now = time.monotonic()
+            cached = getattr(self, attr, None)
+            ttl = getattr(self, "poll_interval", seconds)
+            if not fresh and cached is not None and now - cached[0] < ttl:
+                return cached[1]
+            value = await method(self, *args, **kwargs)
+            setattr(self, attr, (now, value))
+            return value
+
+        return wrapper
+
+    return decorator
 
 
 class SystemMonitor:
     """Monitor system resources and health"""
 
-    def __init__(self):
-        self.psutil_available = True
-        try:
-            import psutil
-        except ImportError:
-            self.psutil_available = False
+    # (binary, check command, returncode meaning "updates available")
+    _PKG_MANAGERS = (
+        ("dnf", ["dnf", "check-update", "--quiet"], 100),
+        ("apt", ["apt", "list", "--upgradable"], 0),
+        ("pacman", ["checkupdates"], 0),
+    )
+
+    # The import at module top already decided availability; a class
+    # attribute keeps the old per-instance flag API without the per-call
+    # try/except dance
+    psutil_available = PSUTIL_AVAILABLE
+
+    def __init__(self, poll_interval: float = 1.0):
+        self.poll_interval = poll_interval
+        # Package managers don't appear mid-run; probe once, lazily
+        self._pkg_mgr = _UNSET
+        # Partition table cache; 60s TTL still catches USB/network mounts
+        self._partitions_cache: tuple[float, list] | None = None
+        # pid -> Process cache so repeated polls reuse instances instead of
+        # re-instantiating (and re-validating) every process each call
+        self._proc_cache: dict[int, psutil.Process] = {}
+        # Prime psutil's internal CPU counters so later non-blocking
+        # cpu_percent(interval=None) calls return a real delta. The very
+        # first reading after startup may still be 0.0.
+        self._boot_time = 0.0
+        self._boot_time_iso = ""
+        if self.psutil_available:
+            try:
+                psutil.cpu_percent(interval=None)
+                # Boot time is immutable for the process; format it once
+                self._boot_time = psutil.boot_time()
+                self._boot_time_iso = datetime.fromtimestamp(self._boot_time).isoformat()
+            except Exception:
+                pass
+
+    def reset_cache(self) -> None:
+        """Drop cached Process objects (e.g. after mass PID churn)"""
+        self._proc_cache.clear()
+
+    def _partitions(self) -> list:
+        """Get disk partitions, re-reading /proc/mounts at most once a minute"""
+        now = time.monotonic()
+        cached = self._partitions_cache
+        if cached is None or now - cached[0] > 60.0:
+            cached = (now, psutil.disk_partitions())
+            self._partitions_cache = cached
+        return cached[1]
+
+    # --- Blocking collectors, shared by the getters and snapshot() ---
+
+    def _cpu_blocking(self) -> dict:
+        # interval=None returns the usage since the previous call without
+        # sleeping; interval=0.1 blocked the worker thread for 100ms
+        cpu_percent = psutil.cpu_percent(interval=None)
+        cpu_freq = psutil.cpu_freq()
+        return {
+            "usage": cpu_percent,
+            "cores": _cpu_count(),
+            "freq_current": cpu_freq.current if cpu_freq else None,
+            "freq_max": cpu_freq.max if cpu_freq else None,
+        }
+
+    def _memory_blocking(self) -> dict:
+        mem = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        return {
+            "total": mem.total,
+            "used": mem.used,
+            "available": mem.available,
+            "percent": mem.percent,
+            "swap_total": swap.total,
+            "swap_used": swap.used,
+            "swap_percent": swap.percent,
+        }
+
+    def _disk_blocking(self) -> list[dict]:
+        # On Linux, reading /proc/mounts and calling statvfs directly skips
+        # psutil's per-entry namedtuple machinery entirely
+        if sys.platform.startswith("linux"):
+            try:
+                return self._disk_blocking_linux()
+            except OSError:
+                pass
+        return self._disk_blocking_psutil()
+
+    def _disk_blocking_linux(self) -> list[dict]:
+        disks = []
+        with open("/proc/mounts") as mounts:
+            for line in mounts:
+                fields = line.split()
+                if len(fields) < 3 or fields[2] in _SKIP_FSTYPES:
+                    continue
+                device, mountpoint, fstype = fields[:3]
+                # /proc/mounts octal-escapes spaces in mountpoints
+                mountpoint = mountpoint.replace("\\040", " ")
+                try:
+                    s = os.statvfs(mountpoint)
+                except OSError:
+                    continue
+                total = s.f_blocks * s.f_frsize
+                if not total:
+                    continue
+                free = s.f_bavail * s.f_frsize
+                used = total - free
+                disks.append(
+                    {
+                        "device": device,
+                        "mountpoint": mountpoint,
+                        "fstype": fstype,
+                        "total": total,
+                        "used": used,
+                        "free": free,
+                        "percent": round(used / total * 100, 1),
+                    }
+                )
+        return disks
+
+    def _disk_blocking_psutil(self) -> list[dict]:
+        def _usage(partition):
+            try:
+                return partition, psutil.disk_usage(partition.mountpoint)
+            except (PermissionError, OSError):
+                return partition, None
+
+        # Filter loop/overlay/tmpfs-style mounts by fstype before spending a
+        # statvfs syscall on results nobody looks at (snap-heavy or
+        # containerized hosts can carry dozens of them)
+        partitions = [p for p in self._partitions() if p.fstype not in _SKIP_FSTYPES]
+        if not partitions:
+            return []
+
+        # statvfs can stall on slow mounts (network shares, spun-down
+        # USB); issuing the calls concurrently makes the scan cost
+        # max(partition times) instead of their sum
+        disks = []
+        with ThreadPoolExecutor(max_workers=min(len(partitions), 8)) as ex:
+            for partition, usage in ex.map(_usage, partitions):
+                if usage is None:
+                    continue
+                disks.append(
+                    {
+                        "device": partition.device,
+                        "mountpoint": partition.mountpoint,
+                        "fstype": partition.fstype,
+                        "total": usage.total,
+                        "used": usage.used,
+                        "free": usage.free,
+                        "percent": usage.percent,
+                    }
+                )
+        return disks
+
+    def _network_blocking(self) -> dict:
+        net_io = psutil.net_io_counters()
+        return {
+            "bytes_sent": net_io.bytes_sent,
+            "bytes_recv": net_io.bytes_recv,
+            "packets_sent": net_io.packets_sent,
+            "packets_recv": net_io.packets_recv,
+        }
 
+    @_ttl_cache(seconds=1.0)
     async def get_cpu_stats(self) -> dict:
         """Get CPU usage statistics"""
         if not self.psutil_available:
             return {}
 
-        def _get_stats():
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            cpu_count = psutil.cpu_count()
-            cpu_freq = psutil.cpu_freq()
-            return {
-                "usage": cpu_percent,
-                "cores": cpu_count,
-                "freq_current": cpu_freq.current if cpu_freq else None,
-                "freq_max": cpu_freq.max if cpu_freq else None,
-            }
-
         try:
-            return await asyncio.to_thread(_get_stats)
+            return await asyncio.to_thread(self._cpu_blocking)
         except Exception:
             return {}
 
+    @_ttl_cache(seconds=1.0)
     async def get_memory_stats(self) -> dict:
         """Get memory (RAM) statistics"""
         if not self.psutil_available:
             return {}
 
-        def _get_stats():
-            mem = psutil.virtual_memory()
-            swap = psutil.swap_memory()
-            return {
-                "total": mem.total,
-                "used": mem.used,
-                "available": mem.available,
-                "percent": mem.percent,
-                "swap_total": swap.total,
-                "swap_used": swap.used,
-                "swap_percent": swap.percent,
-            }
-
         try:
-            return await asyncio.to_thread(_get_stats)
+            return await asyncio.to_thread(self._memory_blocking)
         except Exception:
             return {}
 
+    @_ttl_cache(seconds=1.0)
     async def get_disk_stats(self) -> list[dict]:
         """Get disk usage statistics for all partitions"""
         if not self.psutil_available:
             return []
 
-        def _get_stats():
-            disks = []
-            partitions = psutil.disk_partitions()
-            for partition in partitions:
+        try:
+            return await asyncio.to_thread(self._disk_blocking)
+        except Exception:
+            return []
+
+    @_ttl_cache(seconds=1.0)
+    async def snapshot(self) -> dict:
+        """Get all stats in a single worker-thread hop.
+
+        Each public getter pays its own to_thread round-trip; callers that
+        need the full picture (like get_system_health) fuse them here.
+        """
+        if not self.psutil_available:
+            return {}
+
+        def _snapshot_blocking():
+            snap = {}
+            for key, collect in (
+                ("cpu", self._cpu_blocking),
+                ("memory", self._memory_blocking),
+                ("disk", self._disk_blocking),
+                ("network", self._network_blocking),
+            ):
                 try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    disks.append(
-                        {
-                            "device": partition.device,
-                            "mountpoint": partition.mountpoint,
-                            "fstype": partition.fstype,
-                            "total": usage.total,
-                            "used": usage.used,
-                            "free": usage.free,
-                            "percent": usage.percent,
-                        }
-                    )
-                except PermissionError:
-                    continue
-            return disks
+                    snap[key] = collect()
+                except Exception:
+                    snap[key] = {} if key != "disk" else []
+            return snap
 
         try:
-            return await asyncio.to_thread(_get_stats)
+            return await asyncio.to_thread(_snapshot_blocking)
         except Exception:
-            return []
+            return {}
 
+    @_ttl_cache(seconds=1.0)
     async def get_network_stats(self) -> dict:
         """Get network I/O statistics"""
         if not self.psutil_available:
             return {}
 
-        def _get_stats():
-            net_io = psutil.net_io_counters()
-            return {
-                "bytes_sent": net_io.bytes_sent,
-                "bytes_recv": net_io.bytes_recv,
-                "packets_sent": net_io.packets_sent,
-                "packets_recv": net_io.packets_recv,
-            }
-
         try:
-            return await asyncio.to_thread(_get_stats)
+            return await asyncio.to_thread(self._network_blocking)
         except Exception:
             return {}
 
@@ -120,56 +361,73 @@ class SystemMonitor:
 
         def _get_stats():
             processes = []
-            for proc in psutil.process_iter(
-                ["pid", "name", "cpu_percent", "memory_percent", "memory_info"]
-            ):
+            cache = self._proc_cache
+            pids = psutil.pids()
+            # Drop handles for pids that vanished since the last poll --
+            # the NoSuchProcess branch below only catches pids that are
+            # still listed, so without this the cache grows forever
+            for stale in cache.keys() - set(pids):
+                del cache[stale]
+            for pid in pids:
+                proc = cache.get(pid)
                 try:
-                    pinfo = proc.info
-                    processes.append(
-                        {
-                            "pid": pinfo["pid"],
-                            "name": pinfo["name"],
-                            "cpu_percent": pinfo["cpu_percent"] or 0,
-                            "memory_percent": pinfo["memory_percent"] or 0,
-                            "memory_mb": (pinfo["memory_info"].rss / 1024 / 1024)
-                            if pinfo["memory_info"]
-                            else 0,
-                        }
-                    )
+                    if proc is None:
+                        proc = psutil.Process(pid)
+                        cache[pid] = proc
+                    # oneshot() caches one /proc read across all the getters
+                    # below instead of re-reading stat/status per attribute
+                    with proc.oneshot():
+                        mem_info = proc.memory_info()
+                        processes.append(
+                            {
+                                "pid": pid,
+                                "name": proc.name(),
+                                "cpu_percent": proc.cpu_percent() or 0,
+                                "memory_percent": proc.memory_percent() or 0,
+                                "memory_mb": (mem_info.rss / 1024 / 1024) if mem_info else 0,
+                            }
+                        )
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    cache.pop(pid, None)
                     continue
 
-            sort_key = "cpu_percent" if sort_by == "cpu" else "memory_percent"
-            processes.sort(key=lambda x: x[sort_key], reverse=True)
-            return processes[:limit]
+            # nlargest is O(n log limit) and skips building a fully sorted
+            # copy of the 500+ entry list just to return the top few
+            key = _CPU_KEY if sort_by == "cpu" else _MEM_KEY
+            return heapq.nlargest(limit, processes, key=key)
 
         try:
             return await asyncio.to_thread(_get_stats)
         except Exception:
             return []
 
+    @_ttl_cache(seconds=1.0)
     async def get_system_info(self) -> dict:
         """Get general system information"""
         if not self.psutil_available:
             return {}
 
-        def _get_info():
-            boot_time = datetime.fromtimestamp(psutil.boot_time())
-            uptime = datetime.now() - boot_time
+        # Boot time was cached at construction, so uptime is plain
+        # arithmetic -- no datetime objects and no thread hop needed
+        try:
+            uptime_s = int(time.time() - self._boot_time)
+            days, rest = divmod(uptime_s, 86400)
+            hours, rest = divmod(rest, 3600)
             return {
-                "boot_time": boot_time.isoformat(),
-                "uptime_days": uptime.days,
-                "uptime_hours": uptime.seconds // 3600,
-                "uptime_minutes": (uptime.seconds % 3600) // 60,
+                "boot_time": self._boot_time_iso,
+                "uptime_days": days,
+                "uptime_hours": hours,
+                "uptime_minutes": rest // 60,
             }
-
-        try:
-            return await asyncio.to_thread(_get_info)
         except Exception:
             return {}
 
-    async def get_system_health(self) -> dict:
-        """Get overall system health assessment"""
+    async def get_system_health(self, quick: bool = False) -> dict:
+        """Get overall system health assessment.
+
+        With quick=True, returns as soon as a critical condition is found,
+        skipping the remaining checks and recommendations.
+        """
         health = {
             "status": "healthy",
             "warnings": [],
@@ -177,100 +435,118 @@ class SystemMonitor:
             "recommendations": [],
         }
 
+        # One fused thread hop for everything the checks below need
+        snap = await self.snapshot()
+        cpu = snap.get("cpu", {})
+        mem = snap.get("memory", {})
+        disks = snap.get("disk", [])
+
         # Check CPU
-        cpu = await self.get_cpu_stats()
-        if cpu.get("usage", 0) > 90:
-            health["warnings"].append("CPU usage is very high (>90%)")
+        if cpu.get("usage", 0) > CPU_CRIT:
+            health["warnings"].append(_MSG_CPU_CRIT)
             health["status"] = "warning"
-        elif cpu.get("usage", 0) > 80:
-            health["warnings"].append("CPU usage is high (>80%)")
+        elif cpu.get("usage", 0) > CPU_WARN:
+            health["warnings"].append(_MSG_CPU_WARN)
 
         # Check memory
-        mem = await self.get_memory_stats()
-        if mem.get("percent", 0) > 90:
-            health["issues"].append("Memory usage is critical (>90%)")
+        if mem.get("percent", 0) > MEM_CRIT:
+            health["issues"].append(_MSG_MEM_CRIT)
             health["status"] = "critical"
-        elif mem.get("percent", 0) > 80:
-            health["warnings"].append("Memory usage is high (>80%)")
+        elif mem.get("percent", 0) > MEM_WARN:
+            health["warnings"].append(_MSG_MEM_WARN)
             health["status"] = "warning"
 
+        if quick and health["status"] == "critical":
+            return health
+
         # Check swap
-        if mem.get("swap_percent", 0) > 50:
-            health["warnings"].append("Swap usage is high - consider adding more RAM")
+        if mem.get("swap_percent", 0) > SWAP_WARN:
+            health["warnings"].append(_MSG_SWAP_WARN)
 
-        # Check disk space
-        disks = await self.get_disk_stats()
+        # Check disk space (per-disk messages are only formatted when the
+        # threshold is actually crossed)
         for disk in disks:
-            if disk.get("percent", 0) > 90:
-                health["issues"].append(f"Disk {disk['mountpoint']} is almost full (>90%)")
+            if disk.get("percent", 0) > DISK_CRIT:
+                health["issues"].append(
+                    f"Disk {disk['mountpoint']} is almost full (>{DISK_CRIT}%)"
+                )
                 health["status"] = "critical"
-            elif disk.get("percent", 0) > 80:
-                health["warnings"].append(f"Disk {disk['mountpoint']} is getting full (>80%)")
+                if quick:
+                    return health
+            elif disk.get("percent", 0) > DISK_WARN:
+                health["warnings"].append(
+                    f"Disk {disk['mountpoint']} is getting full (>{DISK_WARN}%)"
+                )
                 if health["status"] == "healthy":
                     health["status"] = "warning"
 
         # Recommendations
-        if mem.get("percent", 0) > 70:
-            health["recommendations"].append("Consider closing unused applications to free memory")
+        if mem.get("percent", 0) > RECOMMEND_LOAD:
+            health["recommendations"].append(_MSG_FREE_MEMORY)
 
-        if cpu.get("usage", 0) > 70:
-            health["recommendations"].append("Check for CPU-intensive processes")
+        if cpu.get("usage", 0) > RECOMMEND_LOAD:
+            health["recommendations"].append(_MSG_CHECK_CPU)
 
         # Check for large files taking up space
-        full_disks = [d for d in disks if d.get("percent", 0) > 80]
-        if full_disks:
-            health["recommendations"].append("Consider cleaning up disk space")
+        if any(d.get("percent", 0) > DISK_WARN for d in disks):
+            health["recommendations"].append(_MSG_CLEAN_DISK)
 
         return health
 
+    def _find_pkg_manager(self):
+        """Detect the system package manager once and cache it"""
+        if self._pkg_mgr is _UNSET:
+            self._pkg_mgr = None
+            for candidate in self._PKG_MANAGERS:
+                # shutil.which does the PATH lookup in-process; no fork/exec
+                if shutil.which(candidate[0]):
+                    self._pkg_mgr = candidate
+                    break
+        return self._pkg_mgr
+
     async def check_updates(self) -> dict:
         """Check for system updates (dnf/apt/pacman)"""
-        managers = [
-            ("dnf", ["dnf", "check-update", "--quiet"], 100),
-            ("apt", ["apt", "list", "--upgradable"], 0),
-            ("pacman", ["checkupdates"], 0),
-        ]
-
-        def _check():
-            found_manager = None
-            for mgr, cmd, success_code in managers:
-                try:
-                    if subprocess.run(["which", mgr], capture_output=True).returncode == 0:
-                        found_manager = (mgr, cmd, success_code)
-                        break
-                except Exception:
-                    continue
+        found_manager = self._find_pkg_manager()
 
-            if not found_manager:
-                return {"available": False, "count": 0, "output": "No supported package manager found"}
+        if not found_manager:
+            return {"available": False, "count": 0, "output": "No supported package manager found"}
 
-            mgr_name, check_cmd, update_code = found_manager
+        mgr_name, check_cmd, update_code = found_manager
 
-            try:
-                result = subprocess.run(check_cmd, capture_output=True, text=True, timeout=15)
-                output = result.stdout or ""
-                count = 0
-
-                if mgr_name == "dnf":
-                    if result.returncode == 100:
-                        lines = [l for l in output.split("\n") if l.strip() and not l.startswith("Last") and not l.startswith("Upgraded")]
-                        count = len(lines)
-                elif mgr_name == "apt":
-                    lines = [l for l in output.split("\n") if l.strip() and "/" in l and "Listing..." not in l]
-                    count = len(lines)
-                elif mgr_name == "pacman":
-                    count = len([l for l in output.split("\n") if l.strip()])
-
-                return {
-                    "available": count > 0,
-                    "count": count,
-                    "output": output[:500] if output else "",
-                    "manager": mgr_name,
-                }
-            except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-                return {"available": False, "count": 0, "output": str(e)}
+        # The event loop's child watcher handles the subprocess directly;
+        # no thread-pool slot is pinned for the (up to 15s) runtime
         try:
-            return await asyncio.to_thread(_check)
+            proc = await asyncio.create_subprocess_exec(
+                *check_cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=15)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+
+            # Count matches on the raw bytes; only the short snippet that is
+            # returned to the caller gets decoded
+            output = stdout or b""
+            count = 0
+
+            if mgr_name == "dnf":
+                if proc.returncode == 100:
+                    count = len(_DNF_UPDATE_RE.findall(output))
+            elif mgr_name == "apt":
+                count = len(_APT_UPDATE_RE.findall(output))
+            elif mgr_name == "pacman":
+                count = len(_PACMAN_UPDATE_RE.findall(output))
+
+            return {
+                "available": count > 0,
+                "count": count,
+                "output": output[:500].decode(errors="replace") if output else "",
+                "manager": mgr_name,
+            }
         except Exception as e:
             return {"available": False, "count": 0, "output": str(e)}
 
@@ -281,29 +557,45 @@ class SystemMonitor:
             return []
 
         def _find_files():
-            large_files = []
-            path_obj = Path(path)
-
-            if not path_obj.exists():
+            if not Path(path).exists():
                 return []
 
-            for item in path_obj.rglob("*"):
+            # Iterative scandir walk: DirEntry carries cached d_type/stat info,
+            # so is_file + stat cost one syscall per entry instead of several
+            # Path-object round trips. A bounded min-heap keeps memory flat on
+            # huge trees instead of collecting everything and sorting.
+            heap: list[tuple[int, str]] = []
+            stack = [path]
+            # Bind hot names locally: the loop body runs once per directory
+            # entry, where global/attribute lookups add up
+            push_dir = stack.append
+            heappush = heapq.heappush
+            heapreplace = heapq.heapreplace
+            threshold = 100 * 1024 * 1024  # Files larger than 100MB
+            while stack:
+                current = stack.pop()
                 try:
-                    if item.is_file():
-                        size = item.stat().st_size
-                        if size > 100 * 1024 * 1024:  # Files larger than 100MB
-                            large_files.append(
-                                {
-                                    "path": str(item),
-                                    "size": size,
-                                    "size_mb": size / (1024 * 1024),
-                                }
-                            )
+                    with os.scandir(current) as entries:
+                        for entry in entries:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    push_dir(entry.path)
+                                elif entry.is_file(follow_symlinks=False):
+                                    size = entry.stat(follow_symlinks=False).st_size
+                                    if size > threshold:
+                                        if len(heap) < limit:
+                                            heappush(heap, (size, entry.path))
+                                        elif size > heap[0][0]:
+                                            heapreplace(heap, (size, entry.path))
+                            except (PermissionError, OSError):
+                                continue
                 except (PermissionError, OSError):
                     continue
 
-            large_files.sort(key=lambda x: x["size"], reverse=True)
-            return large_files[:limit]
+            return [
+                {"path": p, "size": size, "size_mb": size / (1024 * 1024)}
+                for size, p in sorted(heap, reverse=True)
+            ]
 
         try:
             return await asyncio.to_thread(_find_files)
@@ -2,8 +2,21 @@
 Function Tools - Tools that the AI can call
 """
 
+import asyncio
+import datetime
+import functools
+import json
+import math
+import os
+import random
+import re
+import shutil
 import subprocess
+import time
+import traceback
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from typing import Any
 
@@ -65,11 +78,32 @@ ALLOWED_COMMANDS = [
 ]
 
 # Blocked commands (Reduced to extreme danger only)
-BLOCKED_COMMANDS = [
-    "mkfs",
-    "dd",
-    "format",  # Still dangerous disk formatting
-]
+BLOCKED_COMMANDS = frozenset(
+    {
+        "mkfs",
+        "dd",
+        "format",  # Still dangerous disk formatting
+    }
+)
+
+# Commands that require user confirmation before running (see is_sensitive)
+DANGEROUS_COMMANDS = frozenset(
+    {
+        "rm",
+        "sudo",
+        "kill",
+        "killall",
+        "pkill",
+        "reboot",
+        "shutdown",
+        "chmod",
+        "chown",
+        "mv",
+        "cp",
+        "mkdir",
+        "touch",
+    }
+)
 
 
 def run_command(command: str, timeout: int = 30) -> dict[str, Any]:
@@ -81,8 +115,10 @@ def run_command(command: str, timeout: int = 30) -> dict[str, Any]:
 
     base_cmd = cmd_parts[0]
 
-    # Check if command is strictly blocked (formatting etc)
-    if any(blocked in base_cmd.lower() for blocked in BLOCKED_COMMANDS):
+    # Check if command is strictly blocked (formatting etc). One hashed
+    # lookup instead of a substring scan; split on "." so variants like
+    # mkfs.ext4 still match.
+    if base_cmd.lower().split(".", 1)[0] in BLOCKED_COMMANDS:
         return {"error": f"Command '{base_cmd}' is blocked for safety"}
 
     # Warning for sudo usage
@@ -113,6 +149,85 @@ def run_command(command: str, timeout: int = 30) -> dict[str, Any]:
         return {"error": str(e)}
 
 
+def run_commands(commands: list[str], timeout: int = 60) -> dict[str, Any]:
+    """Run several commands sequentially in one tool call.
+
+    Amortizes the tool round-trip (model turn + JSON marshalling) over
+    the whole batch. Each command is exec'd as a split argv with no
+    shell, exactly like run_command, so shell metacharacters in an
+    entry can't smuggle extra commands past BLOCKED_COMMANDS; execution
+    stops at the first failure, matching && semantics.
+    """
+    if not commands:
+        return {"error": "Empty command list"}
+
+    argvs = []
+    for command in commands:
+        parts = command.strip().split()
+        if not parts:
+            return {"error": "Empty command in list"}
+        if parts[0].lower().split(".", 1)[0] in BLOCKED_COMMANDS:
+            return {"error": f"Command '{parts[0]}' is blocked for safety"}
+        argvs.append(parts)
+
+    results = []
+    for command, parts in zip(commands, argvs):
+        try:
+            result = subprocess.run(
+                parts,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                cwd=Path.home(),
+            )
+        except subprocess.TimeoutExpired:
+            return {
+                "commands": commands,
+                "results": results,
+                "error": f"Command '{command}' timed out after {timeout} seconds",
+                "success": False,
+            }
+        except Exception as e:
+            return {"commands": commands, "results": results, "error": str(e), "success": False}
+
+        results.append(
+            {
+                "command": command,
+                "returncode": result.returncode,
+                "stdout": result.stdout,
+                "stderr": result.stderr,
+            }
+        )
+        if result.returncode != 0:
+            return {
+                "commands": commands,
+                "results": results,
+                "returncode": result.returncode,
+                "success": False,
+            }
+
+    return {"commands": commands, "results": results, "returncode": 0, "success": True}
+
+
+def _walk_large_files(root: str, threshold: int):
+    """Yield (path, size) for files above threshold, via os.scandir recursion"""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk_large_files(entry.path, threshold)
+                elif entry.is_file(follow_symlinks=False):
+                    size = entry.stat(follow_symlinks=False).st_size
+                    if size > threshold:
+                        yield entry.path, size
+            except OSError:
+                continue
+
+
 def find_large_files(directory: str = "~", size_mb: int = 100) -> dict[str, Any]:
     """Find files larger than a specific size (MB)"""
     try:
@@ -120,42 +235,48 @@ def find_large_files(directory: str = "~", size_mb: int = 100) -> dict[str, Any]
         if not path.exists():
             return {"error": f"Directory not found: {directory}"}
 
-        cmd = [
-            "find",
-            str(path),
-            "-type",
-            "f",
-            "-size",
-            f"+{size_mb}M",
-            "-exec",
-            "ls",
-            "-lh",
-            "{}",
-            "+",
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Walk in-process instead of forking `find` + `ls` and parsing
+        # their text output; scandir gives us size straight from the stat
+        threshold = size_mb * 1024 * 1024
+        matches = list(_walk_large_files(str(path), threshold))
+        matches.sort(key=lambda m: m[1], reverse=True)
 
-        if result.returncode == 0:
-            return {"files": result.stdout, "count": len(result.stdout.splitlines())}
-        return {"error": result.stderr}
+        return {
+            "files": [
+                {"path": p, "size_mb": round(size / (1024 * 1024), 1)}
+                for p, size in matches[:50]
+            ],
+            "count": len(matches),
+        }
     except Exception as e:
         return {"error": str(e)}
 
 
+# Package manager detection is done once per process; None means "probed,
+# nothing found" and the False sentinel means "not probed yet"
+_PKG_MGR: tuple[str, list[str]] | None | bool = False
+
+
+def _detect_pkg_mgr() -> tuple[str, list[str]] | None:
+    global _PKG_MGR
+    if _PKG_MGR is False:
+        _PKG_MGR = None
+        managers = [
+            ("dnf", ["sudo", "dnf", "check-update"]),
+            ("apt", ["sudo", "apt", "update"]),
+            ("pacman", ["sudo", "pacman", "-Sy"]),
+        ]
+        for mgr, cmd in managers:
+            # shutil.which walks PATH in-process; no fork/exec per probe
+            if shutil.which(mgr):
+                _PKG_MGR = (mgr, cmd)
+                break
+    return _PKG_MGR
+
+
 def system_update() -> dict[str, Any]:
     """Attempt to update the system packages (requires sudo)"""
-    # Detect package manager
-    managers = [
-        ("dnf", ["sudo", "dnf", "check-update"]),
-        ("apt", ["sudo", "apt", "update"]),
-        ("pacman", ["sudo", "pacman", "-Sy"]),
-    ]
-
-    found_manager = None
-    for mgr, cmd in managers:
-        if subprocess.run(["which", mgr], capture_output=True).returncode == 0:
-            found_manager = (mgr, cmd)
-            break
+    found_manager = _detect_pkg_mgr()
 
     if not found_manager:
         return {"error": "No supported package manager found (dnf, apt, pacman)"}
@@ -174,68 +295,73 @@ def system_update() -> dict[str, Any]:
         return {"error": str(e)}
 
 
+# Sandbox environment template for run_python, built once at import.
+# Each call copies it instead of re-inserting two dozen names and
+# re-running the plotext import machinery.
+_BASE_ENV: dict[str, Any] = {
+    "math": math,
+    "json": json,
+    "datetime": datetime,
+    "random": random,
+    "print": print,
+    "range": range,
+    "len": len,
+    "int": int,
+    "float": float,
+    "str": str,
+    "list": list,
+    "dict": dict,
+    "set": set,
+    "tuple": tuple,
+    "bool": bool,
+    "abs": abs,
+    "round": round,
+    "min": min,
+    "max": max,
+    "sum": sum,
+    "sorted": sorted,
+    "enumerate": enumerate,
+    "zip": zip,
+    "map": map,
+    "filter": filter,
+    "any": any,
+    "all": all,
+}
+
+# Try to import plotext (optional terminal plotting)
+try:
+    import plotext as _plotext
+
+    _BASE_ENV["plt"] = _plotext
+except ImportError:
+    _plotext = None
+
+# LLMs tend to re-emit the same snippets (plotting boilerplate etc.);
+# caching the compiled code object skips the parse/compile step, which
+# for short snippets often costs more than running them
+_CODE_CACHE = functools.lru_cache(maxsize=128)(lambda src: compile(src, "<sandbox>", "exec"))
+
+
 def run_python(code: str) -> dict[str, Any]:
     """
     Execute Python code in a restricted environment.
     Supports plotext for terminal plotting.
     """
-    import io
-    import sys
-    import math
-    import json
-    import datetime
-    import random
-
     # Capture stdout/stderr
     buffer = io.StringIO()
-    old_stdout = sys.stdout
-    old_stderr = sys.stderr
-    sys.stdout = buffer
-    sys.stderr = buffer
-
-    # Prepare environment
-    env = {
-        "math": math,
-        "json": json,
-        "datetime": datetime,
-        "random": random,
-        "print": print,
-        "range": range,
-        "len": len,
-        "int": int,
-        "float": float,
-        "str": str,
-        "list": list,
-        "dict": dict,
-        "set": set,
-        "tuple": tuple,
-        "bool": bool,
-        "abs": abs,
-        "round": round,
-        "min": min,
-        "max": max,
-        "sum": sum,
-        "sorted": sorted,
-        "enumerate": enumerate,
-        "zip": zip,
-        "map": map,
-        "filter": filter,
-        "any": any,
-        "all": all,
-    }
 
-    # Try to import plotext
-    try:
-        import plotext as plt
-        plt.clear_figure() # Reset figure before running user code
-        plt.theme("dark") # Set theme
-        env["plt"] = plt
-    except ImportError:
-        print("Warning: plotext not installed")
+    env = _BASE_ENV.copy()
+    if _plotext is not None:
+        _plotext.clear_figure()  # Reset figure before running user code
+        _plotext.theme("dark")  # Set theme
+    else:
+        buffer.write("Warning: plotext not installed\n")
 
     try:
-        # Execute code
-        exec(code, env)
+        # Execute code; redirect_stdout/redirect_stderr restore the real
+        # streams on any exit path, with no manual swap to get wrong
+        with redirect_stdout(buffer), redirect_stderr(buffer):
+            exec(_CODE_CACHE(code), env)
         output = buffer.getvalue()
 
         # If plotext was used, check if there's a plot to show
@@ -249,54 +375,87 @@ def run_python(code: str) -> dict[str, Any]:
             "success": True
         }
     except Exception as e:
-        import traceback
+        # format_exc() walks every frame and reads source files from disk;
+        # a bounded format keeps the useful part (error + innermost frames)
+        # without paying for deep stacks
         return {
             "error": str(e),
-            "traceback": traceback.format_exc(),
+            "traceback": "".join(
+                traceback.format_exception(type(e), e, e.__traceback__, limit=5)
+            ),
             "success": False
         }
-    finally:
-        sys.stdout = old_stdout
-        sys.stderr = old_stderr
+
+
+# Tool handlers are sync (they can be invoked from inside the Textual
+# event loop), while the monitor's getters are coroutines. Each coroutine
+# runs on a private loop in a pool thread; submitting several at once also
+# overlaps their independent /proc reads.
+_POOL = ThreadPoolExecutor(max_workers=6)
+
+
+def _run_async(coro):
+    """Run a coroutine to completion from sync code, even under a loop"""
+    return _POOL.submit(asyncio.run, coro).result()
 
 
 def get_system_info() -> dict[str, Any]:
     """Get system information"""
     monitor = get_monitor()
 
-    return {
-        "cpu": monitor.get_cpu_stats(),
-        "memory": monitor.get_memory_stats(),
-        "disk": monitor.get_disk_stats(),
-        "network": monitor.get_network_stats(),
-        "system": monitor.get_system_info(),
-        "health": monitor.get_system_health(),
+    # Submit everything before collecting anything, so wall time is the
+    # slowest call rather than the sum of all six
+    futures = {
+        "cpu": _POOL.submit(asyncio.run, monitor.get_cpu_stats()),
+        "memory": _POOL.submit(asyncio.run, monitor.get_memory_stats()),
+        "disk": _POOL.submit(asyncio.run, monitor.get_disk_stats()),
+        "network": _POOL.submit(asyncio.run, monitor.get_network_stats()),
+        "system": _POOL.submit(asyncio.run, monitor.get_system_info()),
+        "health": _POOL.submit(asyncio.run, monitor.get_system_health()),
     }
+    return {key: future.result() for key, future in futures.items()}
 
 
 def get_cpu_usage() -> dict[str, Any]:
     """Get CPU usage"""
     monitor = get_monitor()
-    cpu = monitor.get_cpu_stats()
+    cpu = _run_async(monitor.get_cpu_stats())
     return cpu if cpu else {"error": "Could not get CPU stats"}
 
 
 def get_memory_usage() -> dict[str, Any]:
     """Get memory (RAM) usage"""
     monitor = get_monitor()
-    memory = monitor.get_memory_stats()
+    memory = _run_async(monitor.get_memory_stats())
     return memory if memory else {"error": "Could not get memory stats"}
 
 
 def get_disk_space() -> dict[str, Any]:
     """Get disk space information"""
     monitor = get_monitor()
-    disks = monitor.get_disk_stats()
+    disks = _run_async(monitor.get_disk_stats())
     return {"disks": disks} if disks else {"error": "Could not get disk stats"}
 
 
+# nvidia-smi takes 100-300ms just to start up; under rapid polling a
+# short TTL collapses the fork storm into one child per window
+_GPU_CACHE: dict[str, Any] = {"t": 0.0, "v": None}
+_GPU_TTL = 0.5
+
+
 def get_gpu_stats() -> dict[str, Any]:
     """Get GPU statistics"""
+    now = time.monotonic()
+    if _GPU_CACHE["v"] is not None and now - _GPU_CACHE["t"] < _GPU_TTL:
+        return _GPU_CACHE["v"]
+
+    stats = _query_gpu_stats()
+    _GPU_CACHE["t"] = now
+    _GPU_CACHE["v"] = stats
+    return stats
+
+
+def _query_gpu_stats() -> dict[str, Any]:
     try:
         result = subprocess.run(
             [
@@ -322,13 +481,36 @@ def get_gpu_stats() -> dict[str, Any]:
     return {"error": "Could not get GPU stats"}
 
 
+_HOME = str(Path.home().resolve())
+
+# Important files write_file refuses to touch; one compiled regex sweep
+# over the path instead of a Python-level substring test per pattern
+_IMPORTANT_RE = re.compile(r"\.(?:bashrc|zshrc|profile|ssh)(?:/|$)")
+
+
+def _resolve_in_home(filepath: str) -> Path | None:
+    """Expand a path and confirm it lives under the home directory.
+
+    os.path.realpath resolves symlinks and ".." in one C-level pass --
+    much cheaper than the old double Path.resolve(), but unlike a bare
+    string-prefix check it can't be dodged by a symlink inside $HOME
+    pointing outside it. The containment test requires $HOME itself or
+    a path below it, so a sibling like /home/userx can't sneak past a
+    plain prefix match.
+    """
+    real = os.path.realpath(os.path.expanduser(filepath))
+    if real != _HOME and not real.startswith(_HOME + os.sep):
+        return None
+    return Path(real)
+
+
 def read_file(filepath: str) -> dict[str, Any]:
     """Read a file"""
     try:
-        path = Path(filepath).expanduser()
+        path = _resolve_in_home(filepath)
 
         # Security: Don't allow reading outside home directory
-        if not str(path.resolve()).startswith(str(Path.home())):
+        if path is None:
             return {"error": "Can only read files in home directory"}
 
         if not path.exists():
@@ -338,11 +520,17 @@ def read_file(filepath: str) -> dict[str, Any]:
             return {"error": f"Not a file: {filepath}"}
 
         # Limit file size (1MB)
-        if path.stat().st_size > 1024 * 1024:
+        size = path.stat().st_size
+        if size > 1024 * 1024:
             return {"error": "File too large (max 1MB)"}
 
-        with open(path, encoding="utf-8") as f:
-            content = f.read()
+        # We already know the size, so read it in one syscall into one
+        # right-sized buffer instead of going through buffered IO
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            content = os.read(fd, size).decode("utf-8")
+        finally:
+            os.close(fd)
 
         return {
             "filepath": str(path),
@@ -356,15 +544,14 @@ def read_file(filepath: str) -> dict[str, Any]:
 def write_file(filepath: str, content: str) -> dict[str, Any]:
     """Write to a file"""
     try:
-        path = Path(filepath).expanduser()
+        path = _resolve_in_home(filepath)
 
         # Security: Don't allow writing outside home directory
-        if not str(path.resolve()).startswith(str(Path.home())):
+        if path is None:
             return {"error": "Can only write files in home directory"}
 
         # Don't allow overwriting important files
-        important_files = [".bashrc", ".zshrc", ".profile", ".ssh"]
-        if any(important in str(path) for important in important_files):
+        if _IMPORTANT_RE.search(str(path)):
             return {"error": "Cannot overwrite important system files"}
 
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -384,10 +571,10 @@ def write_file(filepath: str, content: str) -> dict[str, Any]:
 def list_files(directory: str = "~") -> dict[str, Any]:
     """List files in a directory"""
     try:
-        path = Path(directory).expanduser()
+        path = _resolve_in_home(directory)
 
         # Security: Don't allow listing outside home directory
-        if not str(path.resolve()).startswith(str(Path.home())):
+        if path is None:
             return {"error": "Can only list files in home directory"}
 
         if not path.exists():
@@ -396,23 +583,34 @@ def list_files(directory: str = "~") -> dict[str, Any]:
         if not path.is_dir():
             return {"error": f"Not a directory: {directory}"}
 
-        files = []
-        for item in path.iterdir():
-            try:
-                stat = item.stat()
-                files.append(
-                    {
-                        "name": item.name,
-                        "type": "directory" if item.is_dir() else "file",
-                        "size": stat.st_size if item.is_file() else None,
-                    }
-                )
-            except PermissionError:
-                continue
+        # os.scandir serves type/size from the directory entry itself, so
+        # each item costs one syscall instead of the ~3 separate stat calls
+        # Path.iterdir + stat + is_dir would make. Rows are collected as
+        # plain tuples so the sort compares tuples directly (dirs first,
+        # then by name) instead of calling a key lambda that does dict
+        # lookups per comparison; dicts are built once, post-sort.
+        rows = []
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    rows.append(
+                        (
+                            0 if is_dir else 1,
+                            entry.name,
+                            None if is_dir else entry.stat(follow_symlinks=False).st_size,
+                        )
+                    )
+                except PermissionError:
+                    continue
+        rows.sort()
 
         return {
             "directory": str(path),
-            "files": sorted(files, key=lambda x: (x["type"] == "file", x["name"])),
+            "files": [
+                {"name": name, "type": "file" if is_file else "directory", "size": size}
+                for is_file, name, size in rows
+            ],
         }
     except Exception as e:
         return {"error": str(e)}
@@ -518,6 +716,24 @@ TOOLS = [
             },
         },
     },
+    {
+        "type": "function",
+        "function": {
+            "name": "run_commands",
+            "description": "Kör flera systemkommandon i följd i ett enda anrop (stoppar vid första felet)",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "commands": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Lista med kommandon att köra i ordning, t.ex. ['mkdir -p ~/x', 'ls ~/x']",
+                    }
+                },
+                "required": ["commands"],
+            },
+        },
+    },
     {
         "type": "function",
         "function": {
@@ -727,26 +943,34 @@ TOOLS = [
     },
 ]
 
+# The schema never changes at runtime and is shipped to Ollama with every
+# request; serialize it once here so callers can splice in the cached
+# string instead of re-walking the dicts
+TOOLS_JSON = json.dumps(TOOLS, separators=(",", ":"))
 
-# Function handler mapping
+
+# Function handler mapping: (handler, takes_no_arguments). Zero-arg
+# handlers are called directly so the common polling tools skip the
+# kwargs-unpacking machinery on every dispatch.
 FUNCTION_HANDLERS = {
-    "list_containers": list_containers,
-    "get_container_logs": get_container_logs,
-    "get_git_status": get_git_status,
-    "git_commit": git_commit,
-    "run_command": run_command,
-    "get_system_info": get_system_info,
-    "get_cpu_usage": get_cpu_usage,
-    "get_memory_usage": get_memory_usage,
-    "get_disk_space": get_disk_space,
-    "get_gpu_stats": get_gpu_stats,
-    "read_file": read_file,
-    "write_file": write_file,
-    "list_files": list_files,
-    "find_large_files": find_large_files,
-    "system_update": system_update,
-    "run_python": run_python,
-    "generate_image": generate_image,
+    "list_containers": (list_containers, False),
+    "get_container_logs": (get_container_logs, False),
+    "get_git_status": (get_git_status, True),
+    "git_commit": (git_commit, False),
+    "run_command": (run_command, False),
+    "run_commands": (run_commands, False),
+    "get_system_info": (get_system_info, True),
+    "get_cpu_usage": (get_cpu_usage, True),
+    "get_memory_usage": (get_memory_usage, True),
+    "get_disk_space": (get_disk_space, True),
+    "get_gpu_stats": (get_gpu_stats, True),
+    "read_file": (read_file, False),
+    "write_file": (write_file, False),
+    "list_files": (list_files, False),
+    "find_large_files": (find_large_files, False),
+    "system_update": (system_update, True),
+    "run_python": (run_python, False),
+    "generate_image": (generate_image, False),
 }
 
 
@@ -764,6 +988,10 @@ def is_sensitive(tool_name: str, args: dict[str, Any]) -> bool:
     if tool_name == "git_commit":
         return True
 
+    if tool_name == "run_commands":
+        commands = args.get("commands") or []
+        return any(is_sensitive("run_command", {"command": cmd}) for cmd in commands)
+
     if tool_name == "run_command":
         cmd = args.get("command", "").strip()
         parts = cmd.split()
@@ -772,25 +1000,8 @@ def is_sensitive(tool_name: str, args: dict[str, Any]) -> bool:
 
         base_cmd = parts[0]
 
-        # Dangerous commands requiring confirmation
-        dangerous = [
-            "rm",
-            "sudo",
-            "kill",
-            "killall",
-            "pkill",
-            "reboot",
-            "shutdown",
-            "chmod",
-            "chown",
-            "mv",
-            "cp",
-            "mkdir",
-            "touch",
-        ]
-
         # Check if base command is dangerous
-        if base_cmd in dangerous:
+        if base_cmd in DANGEROUS_COMMANDS:
             return True
 
         # Check for dangerous flags in any command (e.g. rm inside a complex command)
@@ -803,12 +1014,14 @@ def is_sensitive(tool_name: str, args: dict[str, Any]) -> bool:
 
 def execute_tool_call(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
     """Execute a tool call and return result"""
-    if tool_name not in FUNCTION_HANDLERS:
+    entry = FUNCTION_HANDLERS.get(tool_name)
+    if entry is None:
         return {"error": f"Unknown tool: {tool_name}"}
 
-    handler = FUNCTION_HANDLERS[tool_name]
+    handler, zero_arg = entry
     try:
-        result = handler(**arguments)
-        return result
+        if zero_arg and not arguments:
+            return handler()
+        return handler(**arguments)
     except Exception as e:
         return {"error": str(e)}
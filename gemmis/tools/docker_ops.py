@@ -5,11 +5,29 @@ Docker Operations - Tools for managing Docker containers
 import docker
 from typing import Any
 
+# docker.from_env() opens a fresh unix-socket connection and negotiates
+# the API version every time (~50-200ms); keep one client for the
+# process and reuse its connection pool
+_CLIENT = None
+
+
 def get_docker_client():
-    try:
-        return docker.from_env()
-    except Exception:
-        return None
+    global _CLIENT
+    if _CLIENT is None:
+        try:
+            client = docker.from_env()
+            client.ping()  # Verify the daemon is actually reachable
+            _CLIENT = client
+        except Exception:
+            return None
+    return _CLIENT
+
+
+def _reset_client() -> None:
+    """Drop the cached client so the next call reconnects"""
+    global _CLIENT
+    _CLIENT = None
+
 
 def list_containers(all: bool = False) -> dict[str, Any]:
     """List Docker containers"""
@@ -18,18 +36,23 @@ def list_containers(all: bool = False) -> dict[str, Any]:
         return {"error": "Could not connect to Docker daemon. Is it running?"}
 
     try:
-        containers = client.containers.list(all=all)
+        # The low-level API returns the listing as plain dicts; the SDK's
+        # containers.list() would wrap each entry in a Container object and
+        # fetch the image per container just to reconstruct fields that are
+        # already in the listing
+        raw = client.api.containers(all=all)
         result = []
-        for c in containers:
+        for c in raw:
             result.append({
-                "id": c.short_id,
-                "name": c.name,
-                "status": c.status,
-                "image": c.image.tags[0] if c.image.tags else c.image.id,
-                "ports": c.ports
+                "id": c["Id"][:12],
+                "name": c["Names"][0].lstrip("/") if c.get("Names") else "",
+                "status": c.get("Status", ""),
+                "image": c.get("Image", ""),
+                "ports": c.get("Ports", []),
             })
         return {"containers": result, "count": len(result)}
     except Exception as e:
+        _reset_client()
         return {"error": str(e)}
 
 def get_container_logs(container_id: str, tail: int = 100) -> dict[str, Any]:
@@ -40,7 +63,18 @@ def get_container_logs(container_id: str, tail: int = 100) -> dict[str, Any]:
 
     try:
         container = client.containers.get(container_id)
-        logs = container.logs(tail=tail).decode('utf-8')
+        # Stream with a byte budget instead of materializing the whole
+        # blob; noisy containers can emit KBs per line even with tail=100
+        limit = 256 * 1024
+        chunks = []
+        total = 0
+        for chunk in container.logs(tail=tail, stream=True):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= limit:
+                break
+        logs = b"".join(chunks).decode('utf-8', errors='replace')
         return {"container": container.name, "logs": logs}
     except Exception as e:
+        _reset_client()
         return {"error": str(e)}
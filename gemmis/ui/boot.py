@@ -1,16 +1,42 @@
 """
 GEMMIS Boot Sequence - Cinematic Intro
 """
+import functools
 import time
 import random
 from rich.console import Console
-from rich.panel import Panel
 from rich.layout import Layout
 from rich.live import Live
 from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 from rich.align import Align
-from rich.table import Table
+
+# One bar string per fill level, built once; the progress loop renders
+# 101 frames and would otherwise allocate two block strings plus a
+# concatenation for every frame
+_BAR_WIDTH = 40
+_BARS = tuple(f"[{'█' * i}{'░' * (_BAR_WIDTH - i)}]" for i in range(_BAR_WIDTH + 1))
+
+_LOGO_TEXT = """
+   ▄██████▄     ▄████████   ▄▄▄▄███▄▄▄▄    ▄▄▄▄███▄▄▄▄    ▄█     ▄████████
+  ███    ███   ███    ███ ▄██▀▀▀███▀▀▀██▄ ▄██▀▀▀███▀▀▀██▄ ███    ███    ███
+  ███    █▀    ███    █▀  ███   ███   ███ ███   ███   ███ ███▌   ███    █▀
+ ▄███          ███        ███   ███   ███ ███   ███   ███ ███▌   ███
+▀▀███ ████▄  ▀███████████ ███   ███   ███ ███   ███   ███ ███▌ ▀███████████
+  ███    ███   ███    ███ ███   ███   ███ ███   ███   ███ ███           ███
+  ███    ███   ███    ███ ███   ███   ███ ███   ███   ███ ███     ▄█    ███
+  ████████▀    ███    █▀   ▀█   ███   █▀   ▀█   ███   █▀  █▀    ▄████████▀
+    """
+
+
+@functools.lru_cache(maxsize=4)
+def _logo_renderable(color: str):
+    """Centered logo Text for a color, cached for the process lifetime.
+
+    The color flash alternates between two styles, and a session can boot
+    more than once (theme preview); building the ~700-cell Text each
+    frame is wasted work.
+    """
+    return Align.center(Text(_LOGO_TEXT, style=f"bold {color}"))
 
 def run_boot_sequence(console: Console, theme: str):
     """
@@ -24,12 +50,19 @@ def run_boot_sequence(console: Console, theme: str):
     console.print("[bold green]GEMMIS NEURAL BIOS v3.0[/]")
     console.print(f"[dim]Copyright (C) 2025 GEMINI CORP. All Rights Reserved.[/]")
     console.print(f"[dim]System Date: {time.strftime('%Y-%m-%d %H:%M:%S')}[/]")
-    console.print("[dim]Memory Test: [/]", end="")
-    
-    for i in range(0, 64000, 4000):
-        print(f"\r[dim]Memory Test: {i}K OK[/]", end="")
-        time.sleep(0.001)
-    console.print("\r[dim]Memory Test: 64000K OK[/]")
+    # One Live region instead of raw \r prints: the bare print() calls
+    # bypassed the Console buffer (so the [dim] markup showed literally)
+    # and issued a stdout write per tick
+    mem_msgs = [Text(f"Memory Test: {i}K OK", style="dim") for i in range(0, 64000, 4000)]
+    with Live(mem_msgs[0], console=console, refresh_per_second=30, transient=True) as live:
+        deadline = time.monotonic()
+        for msg in mem_msgs:
+            live.update(msg)
+            deadline += 0.008
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+    console.print("[dim]Memory Test: 64000K OK[/]")
     time.sleep(0.2)
     
     boot_checks = [
@@ -52,17 +85,6 @@ def run_boot_sequence(console: Console, theme: str):
     console.clear()
 
     # 2. The Big Logo Reveal with Progress Bar
-    logo_text = """
-   ▄██████▄     ▄████████   ▄▄▄▄███▄▄▄▄    ▄▄▄▄███▄▄▄▄    ▄█     ▄████████ 
-  ███    ███   ███    ███ ▄██▀▀▀███▀▀▀██▄ ▄██▀▀▀███▀▀▀██▄ ███    ███    ███ 
-  ███    █▀    ███    █▀  ███   ███   ███ ███   ███   ███ ███▌   ███    █▀  
- ▄███          ███        ███   ███   ███ ███   ███   ███ ███▌   ███        
-▀▀███ ████▄  ▀███████████ ███   ███   ███ ███   ███   ███ ███▌ ▀███████████ 
-  ███    ███   ███    ███ ███   ███   ███ ███   ███   ███ ███           ███ 
-  ███    ███   ███    ███ ███   ███   ███ ███   ███   ███ ███     ▄█    ███ 
-  ████████▀    ███    █▀   ▀█   ███   █▀   ▀█   ███   █▀  █▀    ▄████████▀  
-    """
-
     layout = Layout()
     layout.split_column(
         Layout(name="logo", size=10),
@@ -70,32 +92,72 @@ def run_boot_sequence(console: Console, theme: str):
         Layout(name="progress", size=3)
     )
 
-    with Live(layout, console=console, refresh_per_second=20):
+    # auto_refresh would add a background repaint thread racing our own
+    # region updates; with explicit refresh() each deadline tick is drawn
+    # exactly once
+    with Live(layout, console=console, auto_refresh=False) as live:
+        # Only touch a region when its content actually changed; an
+        # .update() marks the region dirty and makes Live re-render it
+        # even if the renderable is identical
+        last = {}
+
+        def update_region(name: str, key, renderable):
+            if last.get(name) != key:
+                last[name] = key
+                layout[name].update(renderable)
+
         # Animate Logo color
+        update_region(
+            "status", "init", Align.center(Text("INITIALIZING NEURAL INTERFACE...", style="dim"))
+        )
+        # Sleep to a monotonic deadline rather than a fixed interval, so
+        # render cost is absorbed into each frame instead of added on top
+        # of it -- plain sleep(0.05) drifts by the cumulative render time
+        deadline = time.monotonic()
         for i in range(20):
             color = "bright_magenta" if i % 2 == 0 else "cyan"
-            layout["logo"].update(Align.center(Text(logo_text, style=f"bold {color}")))
-            layout["status"].update(Align.center(Text("INITIALIZING NEURAL INTERFACE...", style="dim")))
-            time.sleep(0.05)
+            update_region("logo", color, _logo_renderable(color))
+            live.refresh()
+            deadline += 0.05
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
 
-        # Progress Bar
+        # Progress Bar. The loop steps at 100 Hz but we only paint at
+        # 20 Hz, so gate the region updates and refreshes to that
+        # interval -- anything more is rebuilt just to be discarded.
         total_steps = 100
+        min_interval = 1 / 20
+        last_render = -min_interval
+        deadline = time.monotonic()
         for i in range(total_steps + 1):
-            time.sleep(0.01)
-            
-            # Create a manual progress bar using blocks
-            bar_width = 40
-            filled = int(bar_width * (i / total_steps))
-            bar = f"[{'█' * filled}{'░' * (bar_width - filled)}]"
-            
-            layout["progress"].update(Align.center(
-                Text(f"{bar} {i}%", style="bold green")
-            ))
-            
+            deadline += 0.01
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
             if i > 80:
-                layout["status"].update(Align.center(Text("DECRYPTING...", style="bold red blinking")))
+                update_region(
+                    "status",
+                    "decrypt",
+                    Align.center(Text("DECRYPTING...", style="bold red blinking")),
+                )
             elif i > 40:
-                layout["status"].update(Align.center(Text("LOADING ASSETS...", style="bold yellow")))
+                update_region(
+                    "status",
+                    "assets",
+                    Align.center(Text("LOADING ASSETS...", style="bold yellow")),
+                )
+
+            now = time.monotonic()
+            if i == total_steps or now - last_render >= min_interval:
+                last_render = now
+                # Manual progress bar using pre-built block strings
+                filled = int(_BAR_WIDTH * (i / total_steps))
+                layout["progress"].update(Align.center(
+                    Text(f"{_BARS[filled]} {i}%", style="bold green")
+                ))
+                live.refresh()
 
     # Final Flash
     console.clear()
@@ -15,6 +15,8 @@ Box format requires exactly 8 lines of 4 characters each:
   Line 8: bottom     (left, horizontal, divider, right)
 """
 
+import sys
+
 from rich.box import Box
 
 # Circuit Box - Main style with circuit board connectors
@@ -110,3 +112,20 @@ SCAN_BOX = Box(
     "║  ║\n"
     "╙──╜\n"
 )
+
+
+def _intern_box_chars(box: Box) -> None:
+    """Intern every single-char border glyph on a Box.
+
+    Rich compares border characters per cell when rendering; interned
+    strings let those comparisons take CPython's pointer-equality fast
+    path instead of hashing each glyph, across thousands of border cells
+    per Panel render.
+    """
+    for attr, value in vars(box).items():
+        if isinstance(value, str) and len(value) == 1:
+            setattr(box, attr, sys.intern(value))
+
+
+for _box in (CIRCUIT_BOX, TECH_BOX, NEON_BOX, DATA_BUS_BOX, CYBER_GRID_BOX, CYBER_BOX, SCAN_BOX):
+    _intern_box_chars(_box)
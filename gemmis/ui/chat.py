@@ -2,21 +2,44 @@
 GEMMIS Chat UI - Message rendering with theme support and syntax highlighting
 """
 
+import functools
+import itertools
 import re
 import time
 
 from rich import box
 from rich.align import Align
 from rich.console import Group
+from rich.layout import Layout
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.text import Text
 
+from .. import config
 from .theme import get_current_theme
 from .effects import GhostTyper
 from .boxes import TECH_BOX, CYBER_BOX
 
+# Display name derived from config.MODEL_NAME, recomputed only when the
+# model changes. The render functions used to re-import config and redo
+# split/upper on every frame just to pick up model switches.
+_model_display_cache: tuple[str, str] = ("", "")
+
+
+def _get_model_display() -> str:
+    global _model_display_cache
+    name = config.MODEL_NAME
+    cached_name, display = _model_display_cache
+    if name != cached_name:
+        display = name.split(":")[0].upper()
+        _model_display_cache = (name, display)
+    return display
+
+# Pattern to match code blocks: ```language\ncode\n```. Compiled once;
+# render_content_with_code runs per streaming frame
+_CODE_BLOCK_RE = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
+
 
 def render_content_with_code(content: str) -> Group:
     """Render content with syntax highlighting for code blocks.
@@ -25,13 +48,10 @@ def render_content_with_code(content: str) -> Group:
     """
     Colors = get_current_theme()
 
-    # Pattern to match code blocks: ```language\ncode\n```
-    code_pattern = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
-
     parts = []
     last_end = 0
 
-    for match in code_pattern.finditer(content):
+    for match in _CODE_BLOCK_RE.finditer(content):
         # Add text before code block
         if match.start() > last_end:
             text_before = content[last_end : match.start()]
@@ -97,9 +117,8 @@ def render_message(role: str, content: str, width: int = None) -> Panel:
         # Use Markdown rendering for all messages to support tables/formatting
         message_content = Markdown(content)
 
-    # Get model name for assistant messages (import dynamically to get latest value)
-    from ..config import MODEL_NAME as _MODEL_NAME
-    model_display = _MODEL_NAME.split(":")[0].upper()
+    # Get model name for assistant messages
+    model_display = _get_model_display()
 
     if role == "user":
         # User message - right aligned
@@ -128,6 +147,18 @@ def render_message(role: str, content: str, width: int = None) -> Panel:
         )
 
 
+@functools.lru_cache(maxsize=64)
+def _render_message_cached(role: str, content: str, width: int | None, _theme: str, _model: str) -> Panel:
+    """Memoized render_message for history messages.
+
+    History panels are identical between streaming frames, but each frame
+    re-ran Markdown parsing and syntax highlighting for all of them. The
+    theme name and model name are part of the key so a /theme or model
+    switch naturally misses the cache.
+    """
+    return render_message(role, content, width=width)
+
+
 def render_chat(messages: list[dict], max_visible: int = 6) -> Panel:
     """Render chat history panel with theme-aware styling."""
     Colors = get_current_theme()
@@ -136,15 +167,18 @@ def render_chat(messages: list[dict], max_visible: int = 6) -> Panel:
     if not visible:
         welcome_text = Text()
         welcome_text.append("INITIALIZING LINK...\n", style=Colors.DIM)
-        from ..config import MODEL_NAME as _MODEL_NAME
-        model_display = _MODEL_NAME.split(":")[0].upper()
-        welcome_text.append(f"CONNECTED TO {model_display} NET", style=f"bold {Colors.PRIMARY}")
+        welcome_text.append(
+            f"CONNECTED TO {_get_model_display()} NET", style=f"bold {Colors.PRIMARY}"
+        )
         welcome_text.append("\n\n", style=Colors.DIM)
         welcome_text.append("AWAITING INPUT >_", style=f"blink {Colors.SECONDARY}")
         content = Align.center(welcome_text, vertical="middle")
     else:
-        panels = [render_message(m["role"], m["content"]) for m in visible]
-        content = Align(Group(*panels), vertical="bottom")
+        # Feed the panels straight into Group without an intermediate list
+        content = Align(
+            Group(*(render_message(m["role"], m["content"]) for m in visible)),
+            vertical="bottom",
+        )
 
     return Panel(
         content,
@@ -156,6 +190,77 @@ def render_chat(messages: list[dict], max_visible: int = 6) -> Panel:
     )
 
 
+class StreamingChatRenderer:
+    """Retained-mode streaming chat renderer.
+
+    render_chat_streaming rebuilds the full panel stack every tick; this
+    holds a persistent Layout with a history region (touched only when a
+    message lands) and a live region (touched per token), so per-token
+    work is O(live text) rather than O(history + live).
+    """
+
+    def __init__(self, width: int | None = None):
+        self.width = width
+        self.messages: list[dict] = []
+        self.layout = Layout()
+        self.layout.split_column(
+            Layout(name="history", ratio=3),
+            Layout(name="live", ratio=1),
+        )
+        self._refresh_history()
+        self.layout["live"].update(Text(""))
+
+    def _refresh_history(self) -> None:
+        Colors = get_current_theme()
+        model_display = _get_model_display()
+        panels = [
+            _render_message_cached(
+                m["role"], m["content"], self.width, Colors.name, model_display
+            )
+            for m in self.messages
+        ]
+        content = Align(Group(*panels), vertical="bottom") if panels else Text("")
+        self.layout["history"].update(content)
+
+    def push_message(self, message: dict) -> None:
+        """Append a finished message; the history region re-renders once."""
+        self.messages.append(message)
+        self._refresh_history()
+
+    def update_stream(self, text: str, state: str = "generating") -> None:
+        """Update only the live region with the in-flight response."""
+        Colors = get_current_theme()
+        if text and text.count("```") >= 2:
+            display_content = render_content_with_code(text)
+        else:
+            display_content = Text(text, style=Colors.TEXT_PRIMARY)
+            if state in ("generating", "speaking"):
+                display_content.append(" █", style=f"blink {Colors.PRIMARY}")
+        self.layout["live"].update(
+            Panel(
+                display_content,
+                border_style=Colors.BORDER_PRIMARY,
+                style=f"on {Colors.BG_LIGHT}",
+                box=TECH_BOX,
+                padding=(1, 2),
+                width=self.width,
+            )
+        )
+
+    def renderable(self) -> Panel:
+        """The outer panel to hand to Live(); built around the one Layout."""
+        Colors = get_current_theme()
+        return Panel(
+            self.layout,
+            title="[bold green]NEURAL_UPLINK[/]",
+            border_style="bright_cyan",
+            style=f"on {Colors.BG_DARK}",
+            box=CYBER_BOX,
+            padding=(1, 2),
+            expand=True,
+        )
+
+
 def render_chat_streaming(
     messages: list[dict],
     current_response: str,
@@ -164,17 +269,22 @@ def render_chat_streaming(
     console_width: int = None,
     console_height: int = None,
     effects: dict = None,
+    now: float = None,
 ) -> Panel:
-    """Render chat with streaming response - always shows latest messages (autoscroll)."""
+    """Render chat with streaming response - always shows latest messages (autoscroll).
+
+    Callers driving a render loop can pass ``now`` (a time.monotonic()
+    reading) so all time-derived state in the frame shares one clock read.
+    """
     Colors = get_current_theme()
     effects = effects if effects is not None else {}
+    if now is None:
+        now = time.monotonic()
 
     all_messages = list(messages)
-    panels_to_render = []
 
-    # Get model display name (import dynamically to get latest value)
-    from ..config import MODEL_NAME as _MODEL_NAME
-    model_display = _MODEL_NAME.split(":")[0].upper()
+    # Get model display name (re-read per frame to pick up model switches)
+    model_display = _get_model_display()
 
     # Determine widths and heights
     msg_width = int(console_width * 0.85) if console_width else None
@@ -214,25 +324,34 @@ def render_chat_streaming(
                 # Use GhostTyper if available
                 display_content = Text("\n".join(visible_lines), style=Colors.TEXT_PRIMARY)
             else:
-                # If short enough, render with markdown/code support
-                if "```" in current_response:
+                # If short enough, render with markdown/code support.
+                # An odd number of fences means no complete block yet
+                # (mid-stream), so skip the regex scan entirely.
+                if current_response.count("```") >= 2:
                     display_content = render_content_with_code(current_response)
                 else:
                     # GHOST TYPER LOGIC
                     if state in ("generating", "speaking"):
-                        if "ghost_typer" not in effects:
-                            effects["ghost_typer"] = GhostTyper(current_response)
+                        # At ~30 fps vs ~10 tok/s most frames arrive with
+                        # unchanged text; reuse the last styled body then
+                        # (copied, since the cursor append below mutates it)
+                        if current_response == effects.get("_ghost_last_text"):
+                            display_content = effects["_ghost_last_render"].copy()
                         else:
-                            effects["ghost_typer"].update(current_response)
-                        
-                        display_content = effects["ghost_typer"].render()
+                            typer = effects.get("ghost_typer")
+                            if typer is None:
+                                typer = effects["ghost_typer"] = GhostTyper()
+                            typer.update(current_response)
+                            display_content = typer.render()
+                            effects["_ghost_last_text"] = current_response
+                            effects["_ghost_last_render"] = display_content.copy()
                     else:
                         display_content = Text(current_response, style=Colors.TEXT_PRIMARY)
 
         # Add blinking cursor if it's a Text object and we are generating
         # (GhostTyper returns Text, so this still works)
         if isinstance(display_content, Text) and state in ("generating", "speaking"):
-             if int(time.time() * 2) % 2 == 0:
+             if int(now * 2) & 1 == 0:
                 display_content.append(" █", style=f"blink {Colors.PRIMARY}")
 
         current_panel = Panel(
@@ -265,13 +384,7 @@ def render_chat_streaming(
         all_messages[-history_limit:] if len(all_messages) > history_limit else all_messages
     )
 
-    for m in visible_history:
-        panels_to_render.append(render_message(m["role"], m["content"], width=msg_width))
-
-    if current_panel:
-        panels_to_render.append(current_panel)
-
-    if not panels_to_render:
+    if not visible_history and current_panel is None:
         welcome_text = Text()
         welcome_text.append("INITIALIZING SECURE CONNECTION...\n", style=Colors.DIM)
         welcome_text.append(f"ACCESS GRANTED: {model_display}", style=f"bold {Colors.PRIMARY}")
@@ -279,7 +392,14 @@ def render_chat_streaming(
         welcome_text.append("AWAITING INPUT >_", style=f"blink {Colors.SECONDARY}")
         content = Align.center(welcome_text, vertical="middle")
     else:
-        content = Align(Group(*panels_to_render), vertical="bottom")
+        # History panels come straight from the memo cache via a generator,
+        # chained with the live panel -- no intermediate list per frame
+        history_panels = (
+            _render_message_cached(m["role"], m["content"], msg_width, Colors.name, model_display)
+            for m in visible_history
+        )
+        tail = (current_panel,) if current_panel else ()
+        content = Align(Group(*itertools.chain(history_panels, tail)), vertical="bottom")
 
     title_styles = {
         "thinking": (f"[{Colors.WARNING}] SYSTEM BUSY [/]", Colors.WARNING),
@@ -3,8 +3,7 @@ GEMMIS UI CSS
 # Verified OMEGA Update
 """
 
-PRIMARY_COLOR = "#f97ff5" # Synthwave Pink as default base for CSS variables if not overridden
-BACKGROUND_COLOR = "#0a0a0a"
+from .theme import get_current_theme
 
 STATIC_CSS = """
 Screen {
@@ -164,32 +163,63 @@ Tab.-active {
 }
 """
 
+# Theme colors sometimes carry a Rich style prefix ("bold #ff00ff");
+# Textual CSS only accepts the bare color. removeprefix only ever
+# strips a leading "bold ", so an interior match is never touched.
+def clean_color(color: str) -> str:
+    return color.removeprefix("bold ")
+
+
+# Theme color attributes that feed the variables block, in output order.
+_THEME_FIELDS = (
+    "primary",
+    "secondary",
+    "accent",
+    "warning",
+    "error",
+    "success",
+    "dim",
+    "bg_dark",
+    "bg_light",
+    "text_primary",
+    "text_secondary",
+)
+
+# Filled with a single C-level format_map pass per theme; the $-prefixed
+# names are the Textual CSS variables, the braced names the dict keys.
+_VAR_TEMPLATE = (
+    "$primary: {primary};\n"
+    "$secondary: {secondary};\n"
+    "$accent: {accent};\n"
+    "$warning: {warning};\n"
+    "$error: {error};\n"
+    "$success: {success};\n"
+    "$dim: {dim};\n"
+    "$bg-dark: {bg_dark};\n"
+    "$bg-light: {bg_light};\n"
+    "$text-primary: {text_primary};\n"
+    "$text-secondary: {text_secondary};"
+)
+
+# Compiled CSS keyed by theme name. The stylesheet only changes when the
+# theme does, but Textual may ask for it on every reload/refresh.
+_CSS_CACHE: dict[str, str] = {}
+
+
 def get_css() -> str:
-    from .theme import get_current_theme
-    from textwrap import dedent
-    
     theme = get_current_theme()
+    cached = _CSS_CACHE.get(theme.name)
+    if cached is not None:
+        return cached
+
+    colors = {k: clean_color(getattr(theme, k)) for k in _THEME_FIELDS}
+    css = _VAR_TEMPLATE.format_map(colors) + _TAIL
+    _CSS_CACHE[theme.name] = css
+    return css
+
 
-    # We strip the "bold " part if present for CSS hex codes
-    def clean_color(c):
-        return c.replace("bold ", "")
-
-    variables = dedent(f"""
-    $primary: {clean_color(theme.primary)};
-    $secondary: {clean_color(theme.secondary)};
-    $accent: {clean_color(theme.accent)};
-    $warning: {clean_color(theme.warning)};
-    $error: {clean_color(theme.error)};
-    $success: {clean_color(theme.success)};
-    $dim: {clean_color(theme.dim)};
-    $bg-dark: {clean_color(theme.bg_dark)};
-    $bg-light: {clean_color(theme.bg_light)};
-    $text-primary: {clean_color(theme.text_primary)};
-    $text-secondary: {clean_color(theme.text_secondary)};
-    """).strip()
-
-    # OMEGA UPGRADE: CRT SCANLINES & GLOW
-    extra_css = """
+# OMEGA UPGRADE: CRT SCANLINES & GLOW
+_EXTRA_CSS = """
     /* --- OMEGA VISUAL UPGRADES --- */
 
     /* CRT Scanline Simulation */
@@ -493,4 +523,6 @@ def get_css() -> str:
     }
     """
 
-    return variables + STATIC_CSS + extra_css
\ No newline at end of file
+# Static parts concatenated once at import; get_css only prepends the
+# theme variables block
+_TAIL = STATIC_CSS + _EXTRA_CSS
\ No newline at end of file
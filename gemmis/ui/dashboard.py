@@ -3,6 +3,7 @@ GEMMIS Dashboard - Full screen TUI mode
 """
 import asyncio
 import time
+from collections import deque
 from datetime import datetime
 from rich.layout import Layout
 from rich.panel import Panel
@@ -21,12 +22,52 @@ from .theme import get_current_theme
 from ..system_monitor import get_monitor
 from ..state import AppState
 
+# Plot config never changes; built once instead of per frame
+_CHART_CFG = {"height": 10, "colors": [asciichartpy.default]} if asciichartpy else None
+
 class Dashboard:
     def __init__(self, console: Console, state: AppState):
         self.console = console
         self.state = state
         self.monitor = get_monitor()
         self.active = True
+        # Theme can't change while the dashboard owns the screen, so
+        # resolve it once instead of in every render_* call (5x/frame)
+        self.colors = get_current_theme()
+        # The footer never changes and the header only changes its
+        # timestamp; build both panels once and mutate the header Text
+        # in place rather than rebuilding Panel/Text/Style every 250ms
+        self._header_text = Text("", style=self.colors.ACCENT, justify="center")
+        self._header_panel = Panel(
+            self._header_text,
+            title=Text(" GEMMIS DASHBOARD CONTROL ", style=f"bold {self.colors.PRIMARY}"),
+            border_style=self.colors.PRIMARY,
+            box=box.HEAVY
+        )
+        self._footer_panel = Panel(
+            Text("PRESS ESC TO RETURN", justify="center"), style=self.colors.DIM
+        )
+        # Last plotted window per graph title; an idle machine produces
+        # identical windows frame after frame and the chart pass is pure
+        self._graph_cache: dict[str, tuple[tuple, Text]] = {}
+        # Process table and its panel are built once with a fixed row
+        # count; each frame only rewrites the cell strings in place
+        self._proc_rows = 8
+        self._proc_table = Table(
+            box=None, expand=True, show_header=True, header_style=self.colors.SECONDARY
+        )
+        self._proc_table.add_column("PID", style=self.colors.DIM, width=6)
+        self._proc_table.add_column("Name", style=self.colors.PRIMARY)
+        self._proc_table.add_column("CPU%", justify="right", style=self.colors.ACCENT)
+        self._proc_table.add_column("RAM(MB)", justify="right", style=self.colors.TEXT_SECONDARY)
+        for _ in range(self._proc_rows):
+            self._proc_table.add_row("", "", "", "")
+        self._proc_panel = Panel(
+            self._proc_table,
+            title=f"[{self.colors.SECONDARY}] ACTIVE PROCESSES [/]",
+            border_style=self.colors.BORDER_SECONDARY,
+            box=box.ROUNDED
+        )
 
     def create_layout(self) -> Layout:
         layout = Layout()
@@ -50,28 +91,25 @@ class Dashboard:
         return layout
 
     def render_header(self) -> Panel:
-        Colors = get_current_theme()
         t = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        title = Text(" GEMMIS DASHBOARD CONTROL ", style=f"bold {Colors.PRIMARY}")
-        return Panel(
-            Text(f"{t} | SYSTEM ONLINE", style=Colors.ACCENT, justify="center"),
-            title=title,
-            border_style=Colors.PRIMARY,
-            box=box.HEAVY
-        )
+        self._header_text.plain = f"{t} | SYSTEM ONLINE"
+        return self._header_panel
 
-    def render_graph(self, title: str, data: list[float], color: str) -> Panel:
-        Colors = get_current_theme()
+    def render_graph(self, title: str, data: deque[float], color: str) -> Panel:
+        Colors = self.colors
         if not data or not asciichartpy:
             content = Text("No Data / Missing Library", style=Colors.DIM)
         else:
-            # Asciichart needs a list of numbers
-            # Configure cfg for colors
-            cfg = {"height": 10, "colors": [asciichartpy.default]} 
-            # We strip ansi codes from asciichart usually, or just print it.
-            # Rich handles ANSI codes well.
-            chart = asciichartpy.plot(data[-40:], cfg) # Last 40 points
-            content = Text(chart, style=color)
+            # Asciichart needs a list of numbers (deques don't slice).
+            # Rich handles the ANSI codes in its output fine.
+            window = tuple(data)[-40:]  # Last 40 points
+            cached = self._graph_cache.get(title)
+            if cached is not None and cached[0] == window:
+                content = cached[1]
+            else:
+                chart = asciichartpy.plot(list(window), _CHART_CFG)
+                content = Text(chart, style=color)
+                self._graph_cache[title] = (window, content)
 
         return Panel(
             content,
@@ -81,32 +119,29 @@ class Dashboard:
         )
 
     def render_process_list(self) -> Panel:
-        Colors = get_current_theme()
-        procs = self.monitor.get_top_processes(limit=8, sort_by="cpu")
-        
-        table = Table(box=None, expand=True, show_header=True, header_style=Colors.SECONDARY)
-        table.add_column("PID", style=Colors.DIM, width=6)
-        table.add_column("Name", style=Colors.PRIMARY)
-        table.add_column("CPU%", justify="right", style=Colors.ACCENT)
-        table.add_column("RAM(MB)", justify="right", style=Colors.TEXT_SECONDARY)
-        
-        for p in procs:
-            table.add_row(
-                str(p['pid']),
-                p['name'][:15],
-                f"{p['cpu_percent']:.1f}",
-                f"{p['memory_mb']:.0f}"
-            )
-            
-        return Panel(
-            table,
-            title=f"[{Colors.SECONDARY}] ACTIVE PROCESSES [/]",
-            border_style=Colors.BORDER_SECONDARY,
-            box=box.ROUNDED
-        )
+        procs = self.monitor.get_top_processes(limit=self._proc_rows, sort_by="cpu")
+
+        # Write straight into the prebuilt table's cell storage rather
+        # than allocating a Table + columns + rows every 250ms; unused
+        # rows are blanked
+        pid_col, name_col, cpu_col, ram_col = self._proc_table.columns
+        for r in range(self._proc_rows):
+            if r < len(procs):
+                p = procs[r]
+                pid_col._cells[r] = str(p['pid'])
+                name_col._cells[r] = p['name'][:15]
+                cpu_col._cells[r] = f"{p['cpu_percent']:.1f}"
+                ram_col._cells[r] = f"{p['memory_mb']:.0f}"
+            else:
+                pid_col._cells[r] = ""
+                name_col._cells[r] = ""
+                cpu_col._cells[r] = ""
+                ram_col._cells[r] = ""
+
+        return self._proc_panel
 
     def render_sessions(self) -> Panel:
-        Colors = get_current_theme()
+        Colors = self.colors
         content = Text("Memory System Unavailable", style=Colors.DIM)
         
         # Async rendering in sync context is hard, so we rely on cached state or just static info
@@ -137,9 +172,11 @@ class Dashboard:
 
     async def run(self):
         """Run the dashboard loop"""
-        Colors = get_current_theme()
+        Colors = self.colors
         layout = self.create_layout()
-        
+        # Footer is fully static; set it once outside the loop
+        layout["footer"].update(self._footer_panel)
+
         # Pre-fetch sessions if possible
         if self.state.use_memory and self.state.session_manager:
             try:
@@ -157,10 +194,6 @@ class Dashboard:
                     self.state.cpu_history.append(cpu_stats.get('usage', 0))
                 if mem_stats:
                     self.state.mem_history.append(mem_stats.get('percent', 0))
-                
-                # Truncate history for graph
-                if len(self.state.cpu_history) > 50: self.state.cpu_history.pop(0)
-                if len(self.state.mem_history) > 50: self.state.mem_history.pop(0)
 
                 # Update Layout
                 layout["header"].update(self.render_header())
@@ -168,8 +201,7 @@ class Dashboard:
                 layout["mem_graph"].update(self.render_graph("RAM USAGE", self.state.mem_history, Colors.SECONDARY))
                 layout["processes"].update(self.render_process_list())
                 layout["sessions"].update(self.render_sessions())
-                layout["footer"].update(Panel(Text("PRESS ESC TO RETURN", justify="center"), style=Colors.DIM))
-                
+
                 # Check for input (blocking check in a non-blocking way?)
                 # We need a way to detect ESC. 
                 # prompt_toolkit is good for this, but Rich Live takes over stdout.
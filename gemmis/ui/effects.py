@@ -11,20 +11,88 @@ Provides visual effects for the GEMMIS TUI:
 - CRTScanlines: Retro CRT scanline overlay
 - animate_gradient: Color interpolation utility
 """
+import functools
 import math
+import os
 import random
 import time
 from textual.widgets import Static
 from textual.reactive import reactive
 from textual.geometry import Offset
+from rich.style import Style
 from rich.text import Text
 
 from .theme import get_current_theme
 
+# Styles derived from the active theme, rebuilt only when the theme
+# changes. Every effect frame was re-fetching the theme and re-deriving
+# the same "bold {primary}"-style strings per render; pre-parsing into
+# Style objects also spares Rich its Style.parse pass per span.
+_STYLES: dict[str, Style] = {}
+_STYLES_THEME = ""
+
+# Fixed accent styles, parsed once
+_RED_GHOST = Style.parse("dim #ff0040")
+_CYAN_GHOST = Style.parse("dim #00ffff")
+_SCANLINE_DARK = Style.parse("#222222")
+
+# "00 ".."FF " indexed by byte value; spares HexDump a format call (or
+# a hex()/slice pass) per byte emitted
+_HEX = tuple(f"{i:02X} " for i in range(256))
+_SCANLINE_LIGHT = Style.parse("#444444")
+_SCANLINE_FLICKER = Style.parse("#00ff00 dim")
+_GLITCH_LINE_ALT = Style.parse("on #00ff00")
+_GLITCH_LINE = Style.parse("magenta")
+
+
+def _theme_styles() -> dict[str, Style]:
+    global _STYLES, _STYLES_THEME
+    theme = get_current_theme()
+    if theme.name != _STYLES_THEME:
+        primary = theme.primary_clean
+        secondary = theme.secondary_clean
+        dim = theme.dim
+        _STYLES = {
+            "primary": Style.parse(primary),
+            "bold_primary": Style.parse(f"bold {primary}"),
+            "dim_primary": Style.parse(f"dim {primary}"),
+            "bold_secondary": Style.parse(f"bold {secondary}"),
+            "dim": Style.parse(dim),
+            "dim_dim": Style.parse(f"dim {dim}"),
+        }
+        _STYLES_THEME = theme.name
+    return _STYLES
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_hex(color: str) -> tuple[int, int, int]:
+    """Parse a (possibly "bold "-prefixed) hex color into an RGB tuple."""
+    c = color.lstrip('#').replace('bold ', '')
+    return int(c[0:2], 16), int(c[2:4], 16), int(c[4:6], 16)
+
+
+@functools.lru_cache(maxsize=4096)
+def _gradient_step(color_start: str, color_end: str, q: int) -> str:
+    r1, g1, b1 = _parse_hex(color_start)
+    r2, g2, b2 = _parse_hex(color_end)
+
+    # Interpolate
+    t = q / 1000
+    r = int(r1 + (r2 - r1) * t)
+    g = int(g1 + (g2 - g1) * t)
+    b = int(b1 + (b2 - b1) * t)
+
+    return f"#{r:02x}{g:02x}{b:02x}"
+
 
 def animate_gradient(color_start: str, color_end: str, progress: float) -> str:
     """Interpolate between two hex colors.
 
+    Progress is quantized to 1/1000 steps (far below anything a
+    terminal color can show) so that animation ticks revisiting the
+    same fractions hit the memoized step instead of re-parsing and
+    re-interpolating.
+
     Args:
         color_start: Start color in hex format (e.g., '#ff00ff')
         color_end: End color in hex format (e.g., '#00ffff')
@@ -33,21 +101,8 @@ def animate_gradient(color_start: str, color_end: str, progress: float) -> str:
     Returns:
         Interpolated hex color string
     """
-    # Clean colors
-    c1 = color_start.lstrip('#').replace('bold ', '')
-    c2 = color_end.lstrip('#').replace('bold ', '')
-
-    # Parse RGB
-    r1, g1, b1 = int(c1[0:2], 16), int(c1[2:4], 16), int(c1[4:6], 16)
-    r2, g2, b2 = int(c2[0:2], 16), int(c2[2:4], 16), int(c2[4:6], 16)
-
-    # Interpolate
-    progress = max(0.0, min(1.0, progress))
-    r = int(r1 + (r2 - r1) * progress)
-    g = int(g1 + (g2 - g1) * progress)
-    b = int(b1 + (b2 - b1) * progress)
-
-    return f"#{r:02x}{g:02x}{b:02x}"
+    q = round(max(0.0, min(1.0, progress)) * 1000)
+    return _gradient_step(color_start, color_end, q)
 
 
 class MatrixSpinner:
@@ -63,38 +118,79 @@ class MatrixSpinner:
         self.height = height
         self.frame = 0
         self.columns = [random.randint(0, height * 2) for _ in range(width)]
+        self._last_frame_time = 0.0
+        self._cached_text: Text | None = None
 
     def render(self) -> Text:
         """Render the spinner animation frame."""
-        theme = get_current_theme()
-        primary = theme.primary.replace("bold ", "")
+        # Rich calls render at the caller's refresh rate; cap the effect
+        # at ~30 FPS and hand back the previous frame in between
+        now = time.monotonic()
+        if self._cached_text is not None and now - self._last_frame_time < 0.033:
+            return self._cached_text
+
+        styles = _theme_styles()
 
         self.frame += 1
         lines = []
 
+        # At most head + two trail cells light up per column; sample
+        # every character the frame can need in one call up front
+        picks = iter(random.choices(self.CHARS, k=self.width * 3))
+
+        # Column phase is fixed for the frame; compute it once per
+        # column instead of once per cell
+        offset = self.frame // 2
+        wrap = self.height * 2
+        col_pos = [(c + offset) % wrap for c in self.columns]
+
         for y in range(self.height):
             line = Text()
+            # Runs of blank cells join into single appends
+            blanks = 0
             for x in range(self.width):
-                col_pos = (self.columns[x] + self.frame // 2) % (self.height * 2)
+                pos = col_pos[x]
 
-                if col_pos == y:
+                if pos == y:
                     # Brightest char (head)
-                    char = random.choice(self.CHARS)
-                    line.append(char, style=f"bold {primary}")
-                elif col_pos - 1 == y or col_pos - 2 == y:
+                    if blanks:
+                        line.append(" " * blanks)
+                        blanks = 0
+                    line.append(next(picks), style=styles["bold_primary"])
+                elif pos - 1 == y or pos - 2 == y:
                     # Trail
-                    char = random.choice(self.CHARS)
-                    line.append(char, style=f"dim {primary}")
+                    if blanks:
+                        line.append(" " * blanks)
+                        blanks = 0
+                    line.append(next(picks), style=styles["dim_primary"])
                 else:
-                    line.append(" ")
+                    blanks += 1
+            if blanks:
+                line.append(" " * blanks)
             lines.append(line)
 
-        return Text("\n").join(lines)
+        self._last_frame_time = now
+        self._cached_text = Text("\n").join(lines)
+        return self._cached_text
 
     def __rich__(self) -> Text:
         return self.render()
 
 
+# Parsed RGB per base color (None for colors we can't parse), and the
+# formatted style per (color, quantized brightness). 64 brightness
+# levels are below what the eye can tell apart on a border, and the
+# pulse revisits the same levels every cycle, so steady-state frames
+# are pure dict hits with no parsing or string allocation.
+_PULSE_RGB: dict[str, tuple[int, int, int] | None] = {}
+_PULSE_CACHE: dict[tuple[str, int], str] = {}
+
+# One full sine period of the pulse oscillation (the sin(t*pi) term has
+# period 2 in t), sampled at 256 points; a table index replaces the
+# transcendental call per queried border frame
+_PULSE_LUT = tuple(0.5 + 0.5 * math.sin(i / 128 * math.pi) for i in range(256))
+
+
 class PulseBorder:
     """Animated pulsing border effect using color interpolation.
 
@@ -113,24 +209,36 @@ class PulseBorder:
         Returns:
             Style string with current color
         """
-        # Calculate oscillation based on time
+        # Calculate oscillation based on time, via the sine LUT
         t = time.time() * speed
         # Sine wave oscillation between min_brightness and 1.0
-        brightness = min_brightness + (1.0 - min_brightness) * (0.5 + 0.5 * math.sin(t * math.pi))
-
-        # Parse base color
-        color = base_color.lstrip('#').replace('bold ', '')
-        if len(color) == 6:
-            r, g, b = int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
-
-            # Apply brightness
-            r = int(r * brightness)
-            g = int(g * brightness)
-            b = int(b * brightness)
-
-            return f"#{r:02x}{g:02x}{b:02x}"
-
-        return base_color
+        osc = _PULSE_LUT[int(t * 128) & 255]
+        brightness = min_brightness + (1.0 - min_brightness) * osc
+
+        level = int(brightness * 63)
+        key = (base_color, level)
+        cached = _PULSE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        # Parse base color (once per color)
+        rgb = _PULSE_RGB.get(base_color, False)
+        if rgb is False:
+            color = base_color.lstrip('#').replace('bold ', '')
+            rgb = None
+            if len(color) == 6:
+                rgb = int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
+            _PULSE_RGB[base_color] = rgb
+
+        if rgb is None:
+            style = base_color
+        else:
+            # Apply the quantized brightness
+            scale = level / 63
+            style = f"#{int(rgb[0] * scale):02x}{int(rgb[1] * scale):02x}{int(rgb[2] * scale):02x}"
+
+        _PULSE_CACHE[key] = style
+        return style
 
 
 class GlitchText:
@@ -146,12 +254,18 @@ class GlitchText:
         self.duration = duration
         self.glitch_intensity = glitch_intensity
         self.start_time = time.time()
+        self._last_frame_time = 0.0
+        self._cached_text: Text | None = None
 
     def render(self) -> Text:
         """Render the glitched text."""
-        theme = get_current_theme()
-        primary = theme.primary.replace("bold ", "")
-        dim = theme.dim
+        # Cap the glitch animation at ~30 FPS regardless of how often
+        # the surrounding Live/widget refreshes
+        now = time.monotonic()
+        if self._cached_text is not None and now - self._last_frame_time < 0.033:
+            return self._cached_text
+
+        styles = _theme_styles()
 
         elapsed = time.time() - self.start_time
         progress = min(1.0, elapsed / self.duration)
@@ -159,17 +273,41 @@ class GlitchText:
         result = Text()
         reveal_index = int(len(self.target_text) * progress)
 
-        for i, char in enumerate(self.target_text):
-            if i < reveal_index:
-                # Revealed character
-                result.append(char, style=f"bold {primary}")
-            elif random.random() < self.glitch_intensity:
-                # Glitch character
-                result.append(random.choice(self.GLITCH_CHARS), style=f"{dim}")
-            else:
-                # Hidden character
-                result.append("█", style=f"dim {dim}")
-
+        # Revealed prefix is one span, not one per character
+        if reveal_index > 0:
+            result.append(self.target_text[:reveal_index], style=styles["bold_primary"])
+
+        # Sample all glitch characters for the frame in a single C-level
+        # call instead of one random.choice per hidden cell
+        remaining = len(self.target_text) - reveal_index
+        if remaining > 0:
+            rand = random.random
+            glitch_chars = random.choices(self.GLITCH_CHARS, k=remaining)
+            intensity = self.glitch_intensity
+            dim = styles["dim"]
+            dim_dim = styles["dim_dim"]
+            # Coalesce runs of same-styled cells into single spans
+            run: list[str] = []
+            run_style = ""
+            for char in glitch_chars:
+                if rand() < intensity:
+                    # Glitch character
+                    cell, style = char, dim
+                else:
+                    # Hidden character
+                    cell, style = "█", dim_dim
+                if style is run_style:
+                    run.append(cell)
+                else:
+                    if run:
+                        result.append("".join(run), style=run_style)
+                    run = [cell]
+                    run_style = style
+            if run:
+                result.append("".join(run), style=run_style)
+
+        self._last_frame_time = now
+        self._cached_text = result
         return result
 
     @property
@@ -192,35 +330,43 @@ class HexDump:
         self.base_address = base_address or random.randint(0x7F000000, 0x7FFFFFFF)
         self.animate = animate
         self.frame = 0
+        # Row addresses never change for an instance
+        self._addr_strs = [f"0x{self.base_address + i * 16:08X}: " for i in range(lines)]
 
     def render(self) -> Text:
         """Render the hex dump."""
-        theme = get_current_theme()
-        primary = theme.primary.replace("bold ", "")
-        secondary = theme.secondary.replace("bold ", "")
-        dim = theme.dim
+        styles = _theme_styles()
 
         self.frame += 1
         result = Text()
 
+        rand = random.random
         for i in range(self.lines):
-            addr = self.base_address + (i * 16)
-
             # Address
-            result.append(f"0x{addr:08X}: ", style=f"dim {dim}")
+            result.append(self._addr_strs[i], style=styles["dim_dim"])
+
+            # One urandom read gives the whole 16-byte row; byte values
+            # index straight into the precomputed "00 ".."FF " table
+            raw = os.urandom(16)
 
-            # Hex bytes (16 bytes per line)
+            # Hex bytes (16 bytes per line), runs of normal bytes
+            # collapsed into single spans
+            run = []
             for j in range(16):
-                if self.animate and random.random() < 0.05:
+                byte_hex = _HEX[raw[j]]
+                if self.animate and rand() < 0.05:
                     # Occasional "corruption"
-                    byte_val = random.randint(0, 255)
-                    result.append(f"{byte_val:02X} ", style=f"bold {secondary}")
+                    if run:
+                        result.append("".join(run), style=styles["primary"])
+                        run = []
+                    result.append(byte_hex, style=styles["bold_secondary"])
                 else:
-                    byte_val = random.randint(0, 255)
-                    result.append(f"{byte_val:02X} ", style=f"{primary}")
+                    run.append(byte_hex)
 
                 if j == 7:
-                    result.append(" ")
+                    run.append(" ")
+            if run:
+                result.append("".join(run), style=styles["primary"])
 
             if i < self.lines - 1:
                 result.append("\n")
@@ -237,37 +383,45 @@ class GhostTyper:
     Creates a "typing" effect with cursor and optional ghost preview.
     """
 
-    CURSOR_CHARS = ["▌", "▐", "█", " "]
+    CURSOR_CHARS = ("▌", "▐", "█", " ")
 
     def __init__(self, show_cursor: bool = True, ghost_length: int = 3):
         self.show_cursor = show_cursor
         self.ghost_length = ghost_length
         self.frame = 0
         self.text = ""
+        self._last_frame_time = 0.0
+        self._cached_text: Text | None = None
 
     def update(self, text: str) -> None:
         """Update the text content."""
         self.text = text
         self.frame += 1
+        # New content must show immediately, not after the frame cap
+        self._cached_text = None
 
     def render(self) -> Text:
         """Render the ghost typer output."""
-        theme = get_current_theme()
-        primary = theme.primary.replace("bold ", "")
-        dim = theme.dim
+        now = time.monotonic()
+        if self._cached_text is not None and now - self._last_frame_time < 0.033:
+            return self._cached_text
+
+        styles = _theme_styles()
 
         result = Text()
-        result.append(self.text, style=f"{primary}")
+        result.append(self.text, style=styles["primary"])
 
         if self.show_cursor:
             cursor = self.CURSOR_CHARS[self.frame % len(self.CURSOR_CHARS)]
-            result.append(cursor, style=f"bold {primary}")
+            result.append(cursor, style=styles["bold_primary"])
 
         # Ghost preview (placeholder for upcoming chars)
         if self.ghost_length > 0:
-            ghost = "".join(random.choice("░▒▓") for _ in range(self.ghost_length))
-            result.append(ghost, style=f"dim {dim}")
+            ghost = "".join(random.choices("░▒▓", k=self.ghost_length))
+            result.append(ghost, style=styles["dim_dim"])
 
+        self._last_frame_time = now
+        self._cached_text = result
         return result
 
     def __rich__(self) -> Text:
@@ -294,6 +448,9 @@ class CRTScanlines(Static):
         self._opacity = opacity
         self.flicker = flicker
         self.frame = 0
+        # Line Texts keyed by width; all non-flicker lines are
+        # identical frame to frame, so they are built once and shared
+        self._line_cache: dict[int, tuple[Text, Text]] = {}
 
     def on_mount(self) -> None:
         self.display = False
@@ -316,21 +473,27 @@ class CRTScanlines(Static):
         width = self.size.width or 80
         height = self.size.height or 24
 
+        cached = self._line_cache.get(width)
+        if cached is None:
+            cached = (
+                Text("▔" * width, style=_SCANLINE_DARK),
+                Text("▁" * width, style=_SCANLINE_LIGHT),
+            )
+            self._line_cache[width] = cached
+        dark_line, light_line = cached
+
         lines = []
         for y in range(height):
             if y % 2 == 0:
                 # Even lines: subtle dark line
-                line = Text("▔" * width, style="#222222")
-                lines.append(line)
+                lines.append(dark_line)
             else:
                 # Odd lines: brighter scanline
                 if self.flicker and random.random() < 0.05:
                     # Occasional flicker - brighter
-                    style = "#00ff00 dim"  # Green CRT flicker
+                    lines.append(Text("▁" * width, style=_SCANLINE_FLICKER))
                 else:
-                    style = "#444444"
-                line = Text("▁" * width, style=style)
-                lines.append(line)
+                    lines.append(light_line)
 
         return Text("\n").join(lines)
 
@@ -359,8 +522,9 @@ class ChromaticAberration:
         Returns:
             Rich Text object with RGB split effect
         """
-        theme = get_current_theme()
-        primary = theme.primary.replace("bold ", "")
+        styles = _theme_styles()
+        primary = styles["primary"]
+        bold_primary = styles["bold_primary"]
 
         result = Text()
         lines = text.split("\n")
@@ -375,17 +539,29 @@ class ChromaticAberration:
             red_offset = " " * max(0, self.offset)
             cyan_offset = " " * max(0, self.offset)
 
-            # Build the line with color separation
+            # Decide every split point for the line with one sampling
+            # call rather than a random.random() per character
+            threshold = intensity * 0.3
+            splits = random.choices((True, False), cum_weights=(threshold, 1.0), k=len(line))
+
+            # Build the line with color separation, coalescing the
+            # unsplit majority of characters into single spans
+            run: list[str] = []
             for i, char in enumerate(line):
-                if random.random() < intensity * 0.3:
+                if splits[i]:
+                    if run:
+                        result.append("".join(run), style=primary)
+                        run = []
                     # Apply chromatic split on some characters
                     if i > 0:
-                        result.append(line[i - 1], style="dim #ff0040")  # Red ghost
-                    result.append(char, style=f"bold {primary}")
+                        result.append(line[i - 1], style=_RED_GHOST)
+                    result.append(char, style=bold_primary)
                     if i < len(line) - 1:
-                        result.append(line[i + 1], style="dim #00ffff")  # Cyan ghost
+                        result.append(line[i + 1], style=_CYAN_GHOST)
                 else:
-                    result.append(char, style=primary)
+                    run.append(char)
+            if run:
+                result.append("".join(run), style=primary)
 
             if line_idx < len(lines) - 1:
                 result.append("\n")
@@ -407,16 +583,15 @@ class ChromaticAberration:
         result = Text()
 
         # Red channel (offset left)
-        result.append(text[1:] if len(text) > 1 else "", style="dim #ff0040")
+        result.append(text[1:] if len(text) > 1 else "", style=_RED_GHOST)
         result.append("\n")
 
         # Main channel
-        theme = get_current_theme()
-        result.append(text, style=theme.primary.replace("bold ", ""))
+        result.append(text, style=_theme_styles()["primary"])
         result.append("\n")
 
         # Cyan channel (offset right)
-        result.append(" " + text[:-1] if len(text) > 1 else "", style="dim #00ffff")
+        result.append(" " + text[:-1] if len(text) > 1 else "", style=_CYAN_GHOST)
 
         return result
 
@@ -424,6 +599,11 @@ class ChromaticAberration:
 class GlitchOverlay(Static):
     """A full-screen transparent overlay that creates digital glitches."""
 
+    GLITCH_CHARS = " ░▒▓█01_-"
+    # Equivalent to "30% uniform pick over GLITCH_CHARS, else space":
+    # space lands with 0.7 + 0.3/9 = 22/30, each glyph with 1/30
+    GLITCH_CUM_WEIGHTS = (22, 23, 24, 25, 26, 27, 28, 29, 30)
+
     def on_mount(self) -> None:
         self.display = False
         self.set_interval(0.15, self.tick)  # Slower to reduce CPU
@@ -453,14 +633,25 @@ class GlitchOverlay(Static):
         height = self.size.height
         if width == 0 or height == 0: return Text("")
 
-        chars = " ░▒▓█01_-"
-        lines = []
+        # Assemble the whole overlay as one Text from per-row segments
+        # instead of allocating a Text per row and joining; each row is
+        # a single style so nothing is lost
+        chars = self.GLITCH_CHARS
+        blank = " " * width + "\n"
+        segments = []
         for _ in range(height):
             if random.random() < self.intensity:
-                # Create a horizontal glitch line
-                line = "".join(random.choice(chars) if random.random() < 0.3 else " " for _ in range(width))
-                lines.append(Text(line, style="on #00ff00" if random.random() > 0.9 else "magenta"))
+                # Create a horizontal glitch line; one weighted
+                # choices() call samples the whole row instead of two
+                # RNG calls per cell
+                line = "".join(
+                    random.choices(chars, cum_weights=self.GLITCH_CUM_WEIGHTS, k=width)
+                )
+                segments.append((line + "\n", _GLITCH_LINE_ALT if random.random() > 0.9 else _GLITCH_LINE))
             else:
-                lines.append(Text(" " * width))
-        
-        return Text("\n").join(lines)
+                segments.append(blank)
+
+        # Drop the trailing newline from the last row
+        last = segments[-1]
+        segments[-1] = (last[0][:-1], last[1]) if isinstance(last, tuple) else last[:-1]
+        return Text.assemble(*segments)
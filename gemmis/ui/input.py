@@ -2,6 +2,7 @@
 GEMMIS UI Input - Advanced input handling with prompt_toolkit
 """
 
+import functools
 import os
 from pathlib import Path
 from prompt_toolkit import PromptSession
@@ -9,6 +10,26 @@ from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.styles import Style
 from prompt_toolkit.formatted_text import HTML
 
+
+@functools.lru_cache(maxsize=64)
+def _list_dir_cached(dirname: str, mtime_ns: int) -> tuple[tuple[str, bool], ...]:
+    """(name, is_dir) entries for a directory at a given mtime.
+
+    scandir reads the type from the dirent, so there is no stat call per
+    entry the way os.listdir + os.path.isdir costs; keying the cache on
+    the directory's mtime means rapid keystrokes refining the same path
+    reuse one listing while edits to the directory invalidate it.
+    """
+    with os.scandir(dirname) as entries:
+        return tuple(
+            (entry.name, entry.is_dir(follow_symlinks=False)) for entry in entries
+        )
+
+
+def _list_dir(dirname: str) -> tuple[tuple[str, bool], ...]:
+    return _list_dir_cached(dirname, os.stat(dirname).st_mtime_ns)
+
+
 class GemmisCompleter(Completer):
     """
     Custom completer that provides:
@@ -57,14 +78,10 @@ class GemmisCompleter(Completer):
                 dirname = "."
                 
             try:
-                for name in os.listdir(dirname):
+                for name, is_dir in _list_dir(dirname):
                     if name.startswith(basename):
                         # Add trailing slash for directories
-                        full_path = os.path.join(dirname, name)
-                        display = name
-                        if os.path.isdir(full_path):
-                            display += "/"
-                        
+                        display = name + "/" if is_dir else name
                         yield Completion(display, start_position=-len(basename))
             except Exception:
                 pass
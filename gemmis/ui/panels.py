@@ -24,9 +24,9 @@ def _get_avatar_templates() -> dict[str, str]:
     Colors = get_current_theme()
 
     # Extract color values for avatar markup
-    primary = Colors.primary.replace("bold ", "")
-    secondary = Colors.secondary.replace("bold ", "")
-    warning = Colors.warning.replace("bold ", "")
+    primary = Colors.primary_clean
+    secondary = Colors.secondary_clean
+    warning = Colors.warning_clean
 
     return {
         "idle": f"""
@@ -9,9 +9,10 @@ Five premium themes with distinct visual signatures:
 - Obsidian: Minimalist void
 """
 
+import functools
 from dataclasses import dataclass
 
-from rich.text import Text
+from rich.text import Span, Text
 
 
 @dataclass
@@ -104,6 +105,37 @@ class Theme:
     def BORDER_SECONDARY(self) -> str:
         return self.border_secondary
 
+    # Colors with any "bold " prefix stripped, computed once per theme.
+    # Renderers need the bare color for style composition and were
+    # re-allocating these strings on every frame.
+    @functools.cached_property
+    def primary_clean(self) -> str:
+        return self.primary.removeprefix("bold ")
+
+    @functools.cached_property
+    def secondary_clean(self) -> str:
+        return self.secondary.removeprefix("bold ")
+
+    @functools.cached_property
+    def accent_clean(self) -> str:
+        return self.accent.removeprefix("bold ")
+
+    @functools.cached_property
+    def warning_clean(self) -> str:
+        return self.warning.removeprefix("bold ")
+
+    @functools.cached_property
+    def error_clean(self) -> str:
+        return self.error.removeprefix("bold ")
+
+    @functools.cached_property
+    def success_clean(self) -> str:
+        return self.success.removeprefix("bold ")
+
+    @functools.cached_property
+    def primary_rgb(self) -> tuple[int, int, int]:
+        return self._hex_to_rgb(self.primary_clean)
+
     def gradient_text(self, text: str) -> Text:
         """Create gradient-colored text using 24-bit TrueColor.
 
@@ -114,30 +146,17 @@ class Theme:
         if not self.gradient_start or not self.gradient_end:
             return Text(text, style=self.primary)
 
-        result = Text()
-
-        # Parse hex colors
-        start = self._hex_to_rgb(self.gradient_start)
-        end = self._hex_to_rgb(self.gradient_end)
-
         length = len(text)
         if length <= 1:
             return Text(text, style=f"bold #{self.gradient_start.lstrip('#')}")
 
-        for i, char in enumerate(text):
-            # Calculate interpolation factor
-            t = i / (length - 1)
-
-            # Interpolate RGB values
-            r = int(start[0] + (end[0] - start[0]) * t)
-            g = int(start[1] + (end[1] - start[1]) * t)
-            b = int(start[2] + (end[2] - start[2]) * t)
+        styles = _gradient_styles(self.gradient_start, self.gradient_end, length)
 
-            # Create hex color
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            result.append(char, style=f"bold {color}")
-
-        return result
+        # Every character gets a distinct color, so build the span list
+        # directly instead of one append (string concat + Span alloc +
+        # list append) per character
+        spans = [Span(i, i + 1, style) for i, style in enumerate(styles)]
+        return Text(text, spans=spans)
 
     @staticmethod
     def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
@@ -146,6 +165,29 @@ class Theme:
         return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
 
 
+@functools.lru_cache(maxsize=256)
+def _gradient_styles(start_hex: str, end_hex: str, n: int) -> tuple[str, ...]:
+    """Interpolated "bold #rrggbb" styles between two hex colors.
+
+    Pure in its arguments, and callers pass the same few
+    (endpoints, length) combinations over and over -- banner and header
+    strings have stable lengths -- so the palette is memoized and repeat
+    renders skip the color math entirely.
+
+    Computed in one pass with the per-step deltas hoisted out of the
+    loop, so each character costs three multiply-adds and one format
+    instead of re-deriving the interpolation factor and endpoints.
+    """
+    r1, g1, b1 = Theme._hex_to_rgb(start_hex)
+    r2, g2, b2 = Theme._hex_to_rgb(end_hex)
+    step = 1 / (n - 1)
+    dr, dg, db = (r2 - r1) * step, (g2 - g1) * step, (b2 - b1) * step
+    return tuple(
+        f"bold #{int(r1 + dr * i):02x}{int(g1 + dg * i):02x}{int(b1 + db * i):02x}"
+        for i in range(n)
+    )
+
+
 # =============================================================================
 # THEME DEFINITIONS
 # =============================================================================
@@ -166,11 +166,11 @@ class GPUGauge(Static):
         """Get color based on temperature thresholds."""
         theme = get_current_theme()
         if self.temperature >= 80:
-            return theme.error.replace("bold ", "")
+            return theme.error_clean
         elif self.temperature >= 70:
-            return theme.warning.replace("bold ", "")
+            return theme.warning_clean
         else:
-            return theme.success.replace("bold ", "")
+            return theme.success_clean
 
     def _update_warning_state(self) -> None:
         """Update CSS classes based on GPU state."""
@@ -208,11 +208,11 @@ class GPUMiniStats(Static):
 
             # Color based on utilization
             if util >= 80:
-                color = theme.error.replace("bold ", "")
+                color = theme.error_clean
             elif util >= 50:
-                color = theme.warning.replace("bold ", "")
+                color = theme.warning_clean
             else:
-                color = theme.success.replace("bold ", "")
+                color = theme.success_clean
 
             bar = render_block_bar(util, width=8, theme_color=color)
 
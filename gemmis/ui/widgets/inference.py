@@ -76,15 +76,15 @@ class InferenceStats(Static):
     def _update_display(self) -> None:
         """Update all display elements."""
         theme = get_current_theme()
-        primary = theme.primary.replace("bold ", "")
-        secondary = theme.secondary.replace("bold ", "")
-        warning = theme.warning.replace("bold ", "")
+        primary = theme.primary_clean
+        secondary = theme.secondary_clean
+        warning = theme.warning_clean
 
         # Update T/s value with color coding
         try:
             tps_label = self.query_one("#tps-value", Label)
             if self.tokens_per_sec >= 30:
-                color = theme.success.replace("bold ", "")
+                color = theme.success_clean
             elif self.tokens_per_sec >= 15:
                 color = primary
             elif self.tokens_per_sec > 0:
@@ -110,7 +110,7 @@ class InferenceStats(Static):
             ctx_percent = (self.context_used / max(self.context_max, 1)) * 100
 
             if ctx_percent >= 90:
-                color = theme.error.replace("bold ", "")
+                color = theme.error_clean
             elif ctx_percent >= 70:
                 color = warning
             else:
@@ -152,11 +152,11 @@ class InferenceMini(Static):
             label = self.query_one("#inf-mini-label", Label)
 
             if self.tps >= 30:
-                color = theme.success.replace("bold ", "")
+                color = theme.success_clean
             elif self.tps >= 15:
-                color = theme.primary.replace("bold ", "")
+                color = theme.primary_clean
             elif self.tps > 0:
-                color = theme.warning.replace("bold ", "")
+                color = theme.warning_clean
             else:
                 color = theme.dim
 
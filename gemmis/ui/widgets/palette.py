@@ -114,7 +114,7 @@ class CommandPalette(Static):
 
             theme = get_current_theme()
             text = Text()
-            text.append(name, style=f"bold {theme.primary.replace('bold ', '')}")
+            text.append(name, style=f"bold {theme.primary_clean}")
             text.append(f"  {desc}", style=theme.dim)
 
             list_view.append(ListItem(Label(text), name=action))
@@ -262,9 +262,9 @@ class KeybindHelp(Static):
 
     def compose(self) -> ComposeResult:
         theme = get_current_theme()
-        primary = theme.primary.replace("bold ", "")
-        secondary = theme.secondary.replace("bold ", "")
-        accent = theme.accent.replace("bold ", "")
+        primary = theme.primary_clean
+        secondary = theme.secondary_clean
+        accent = theme.accent_clean
 
         with Container(id="help-container"):
             yield Static(
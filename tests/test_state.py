@@ -24,8 +24,10 @@ class TestAppState:
         await state.add_message("user", "Hello")
 
         assert len(state.messages) == 1
-        assert state.messages[0]["role"] == "user"
-        assert state.messages[0]["content"] == "Hello"
+        role, content, tool_calls = state.messages[0]
+        assert role == "user"
+        assert content == "Hello"
+        assert tool_calls is None
 
     @pytest.mark.asyncio
     async def test_add_multiple_messages(self):
@@ -36,9 +38,9 @@ class TestAppState:
         await state.add_message("user", "How are you?")
 
         assert len(state.messages) == 3
-        assert state.messages[0]["role"] == "user"
-        assert state.messages[1]["role"] == "assistant"
-        assert state.messages[2]["role"] == "user"
+        assert state.messages[0][0] == "user"
+        assert state.messages[1][0] == "assistant"
+        assert state.messages[2][0] == "user"
 
     @pytest.mark.asyncio
     async def test_get_chat_messages_includes_system(self):
@@ -55,10 +57,10 @@ class TestAppState:
         assert messages[1]["content"] == "Hello"
 
     def test_history_tracking(self):
-        """CPU and memory history lists should be initialized."""
+        """CPU and memory history buffers should be initialized and bounded."""
         state = AppState()
-        assert state.cpu_history == []
-        assert state.mem_history == []
+        assert len(state.cpu_history) == 0
+        assert len(state.mem_history) == 0
 
         # Should be appendable
         state.cpu_history.append(50.0)
@@ -66,3 +68,9 @@ class TestAppState:
 
         assert len(state.cpu_history) == 1
         assert len(state.mem_history) == 1
+
+        # Old samples are evicted once the ring buffer is full
+        for i in range(100):
+            state.cpu_history.append(float(i))
+        assert len(state.cpu_history) == 50
+        assert state.cpu_history[-1] == 99.0